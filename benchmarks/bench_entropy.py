@@ -0,0 +1,105 @@
+"""
+Banc d'essai des codeurs entropiques
+Compare taille et débit de chaque backend enregistré sur les mêmes résidus,
+puis le temps de construction des codes de Huffman selon la taille de l'alphabet
+
+Usage: python benchmarks/bench_entropy.py [durée_secondes]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+src_path = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from compression.quantification import compute_mean, normalisation, quantification
+from compression.encoding import delta_encode, huffman_code_lengths
+from compression.entropy import ENTROPY_CODERS
+
+
+def make_residuals(signal: np.ndarray) -> np.ndarray:
+    """Applique la chaîne de prétraitement du compresseur jusqu'au Delta"""
+    centered, _ = compute_mean(signal)
+    normalized, _ = normalisation(centered)
+    return delta_encode(quantification(normalized))
+
+
+def synthetic_signals(seconds: float, rate: int = 22050) -> dict:
+    """Signaux de test déterministes"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * rate)) / rate
+    music = 6000 * np.sin(2 * np.pi * 220 * t) + 3000 * np.sin(2 * np.pi * 331 * t)
+    music += 800 * rng.standard_normal(len(t))
+    speech = np.sin(2 * np.pi * 180 * t) * (np.sin(2 * np.pi * 3 * t) > 0.3) * 9000
+    speech += 50 * rng.standard_normal(len(t))
+    return {
+        'music': music,
+        'speech': speech,
+        'noise': 10000 * rng.standard_normal(len(t)),
+    }
+
+
+# Tailles d'alphabet du banc de construction des codes
+ALPHABET_SIZES = (1_000, 10_000, 50_000, 200_000)
+
+
+def bench_code_lengths(sizes=ALPHABET_SIZES, repeats: int = 3) -> list:
+    """
+    Mesure la construction des longueurs de Huffman (méthode des deux files).
+    
+    Les poids valent w^2 avec w tiré dans [1, 1000): beaucoup de symboles
+    rares et quelques fréquents, comme les paires RLE d'un signal réel.
+    
+    Args:
+        sizes: Tailles d'alphabet à mesurer
+        repeats: Nombre de mesures (la meilleure est gardée)
+        
+    Returns:
+        list: (taille de l'alphabet, secondes, longueur maximale) par taille
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for size in sizes:
+        weights = rng.integers(1, 1000, size) ** 2
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            lengths = huffman_code_lengths(weights)
+            best = min(best, time.perf_counter() - start)
+        results.append((size, best, int(lengths.max())))
+    return results
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    print(f"{'signal':8s} {'codeur':14s} {'octets':>10s} {'bits/éch':>9s} "
+          f"{'enc Méch/s':>11s} {'dec Méch/s':>11s}")
+          
+    for name, signal in synthetic_signals(seconds).items():
+        residuals = make_residuals(signal)
+        for coder in ENTROPY_CODERS.values():
+            start = time.perf_counter()
+            num_symbols, table, payload = coder.encode(residuals)
+            encode_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            decoded = coder.decode(table, payload, num_symbols, len(residuals))
+            decode_time = time.perf_counter() - start
+            
+            if not np.array_equal(decoded, residuals):
+                raise RuntimeError(f"Aller-retour incorrect: {coder.name} sur {name}")
+                
+            size = len(table) + len(payload)
+            print(f"{name:8s} {coder.name:14s} {size:10d} {8 * size / len(residuals):9.3f} "
+                  f"{len(residuals) / encode_time / 1e6:11.2f} {len(residuals) / decode_time / 1e6:11.2f}")
+                  
+    print(f"\n{'alphabet':>10s} {'secondes':>10s} {'long. max':>10s}")
+    for size, elapsed, max_length in bench_code_lengths():
+        print(f"{size:10d} {elapsed:10.4f} {max_length:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Banc d'essai par étage de la chaîne de compression
+Mesure chaque fonction du paquet compression isolément, sur des signaux
+synthétiques déterministes de plusieurs durées
+
+Usage: python benchmarks/bench_stages.py [--durations 1 10 60] [--repeat 3]
+                                         [--output stages.json] [--compare precedent.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+src_path = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from compression.stereotreatment import process_stereo_sound
+from compression.quantification import compute_mean, normalisation, quantification
+from compression.encoding import (
+    delta_encode, rle_encode, pack_rle_symbols, huffman_code_lengths,
+    huffman_encode_rle, huffman_decode_rle
+)
+from signals import SIGNALS
+
+
+def best_time(function, *args, repeat: int = 3):
+    """Meilleur temps sur `repeat` exécutions, et résultat de la dernière"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def build_huffman_tree(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Histogramme des paires RLE puis longueurs de l'arbre de Huffman"""
+    _, weights = np.unique(pack_rle_symbols(values, counts), return_counts=True)
+    return huffman_code_lengths(weights)
+
+
+def bench_signal(samples: np.ndarray, channels: int, repeat: int) -> list:
+    """
+    Chronomètre chaque étage sur un signal, dans l'ordre de la chaîne.
+    
+    Chaque étage reçoit la sortie de l'étage précédent; le débit est
+    rapporté à la taille de son entrée.
+    
+    Returns:
+        list: Un dict par étage (secondes, éléments et octets en entrée)
+    """
+    results = []
+    
+    def stage(name, function, *args):
+        seconds, result = best_time(function, *args, repeat=repeat)
+        first = args[0]
+        items = len(first)
+        size = first.nbytes
+        if len(args) > 1 and isinstance(args[1], np.ndarray):
+            size += args[1].nbytes
+        results.append({'stage': name, 'seconds': seconds, 'items': items, 'bytes': size})
+        return result
+        
+    if channels == 2:
+        _, samples = stage('process_stereo_sound', process_stereo_sound, samples)
+        
+    centered, _ = stage('compute_mean', compute_mean, samples)
+    normalized, _ = stage('normalisation', normalisation, centered)
+    quantized = stage('quantification', quantification, normalized)
+    residuals = stage('delta_encode', delta_encode, quantized)
+    values, counts = stage('rle_encode', rle_encode, residuals)
+    stage('build_huffman_tree', build_huffman_tree, values, counts)
+    encoded, codebook = stage('huffman_encode_rle', huffman_encode_rle, values, counts)
+    
+    seconds, decoded = best_time(huffman_decode_rle, encoded, codebook, len(values), repeat=repeat)
+    results.append({'stage': 'huffman_decode_rle', 'seconds': seconds,
+                    'items': len(values), 'bytes': (len(encoded) + 7) // 8})
+    if not (np.array_equal(decoded[0], values) and np.array_equal(decoded[1], counts)):
+        raise RuntimeError("Aller-retour Huffman incorrect")
+    return results
+
+
+def git_revision() -> str:
+    """Commit courant (None hors d'un dépôt git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai par étage")
+    parser.add_argument('--durations', type=float, nargs='+', default=[1.0, 10.0, 60.0],
+                        help="durées des signaux en secondes")
+    parser.add_argument('--repeat', type=int, default=3, help="exécutions par mesure (meilleur temps)")
+    parser.add_argument('--output', help="fichier JSON des résultats")
+    parser.add_argument('--compare', help="résultats JSON d'un commit précédent")
+    args = parser.parse_args()
+    
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'repeat': args.repeat,
+        'results': [],
+    }
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = {(r['signal'], r['seconds_of_audio'], r['stage']): r
+                        for r in json.load(f)['results']}
+                        
+    print(f"{'signal':8s} {'durée':>6s} {'étage':20s} {'ms':>9s} {'Méch/s':>9s} {'Mo/s':>9s}"
+          + (f" {'vs préc.':>9s}" if previous else ""))
+    for duration in args.durations:
+        for name, (generate, channels) in SIGNALS.items():
+            for result in bench_signal(generate(duration), channels, args.repeat):
+                seconds = max(result['seconds'], 1e-9)
+                result.update({
+                    'signal': name,
+                    'seconds_of_audio': duration,
+                    'samples_per_s': result['items'] / seconds,
+                    'bytes_per_s': result['bytes'] / seconds,
+                })
+                report['results'].append(result)
+                
+                line = (f"{name:8s} {duration:6g} {result['stage']:20s} {1000 * result['seconds']:9.3f} "
+                        f"{result['samples_per_s'] / 1e6:9.2f} {result['bytes_per_s'] / 1e6:9.2f}")
+                reference = previous.get((name, duration, result['stage']))
+                if reference:
+                    line += f" {reference['seconds'] / seconds:8.2f}x"
+                print(line)
+                
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Harnais de non-régression de bout en bout
+Compresse puis décompresse un corpus de référence généré et rapporte, pour
+chaque fichier: taux de réduction, temps d'encodage et de décodage, pic de
+mémoire et SNR de la reconstruction. Échoue (code 1) si un seuil est franchi
+ou si le décodage d'une plage diffère du décodage complet
+
+Usage: python benchmarks/regression.py [--seconds 20] [--output rapport.json]
+                                       [--baseline precedent.json] [--min-ratio 50]
+                                       [--max-ratio-drop 1.0] [--max-slowdown 1.5]
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+src_path = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from signals import SIGNALS, RATE, write_wav
+from bench_stages import git_revision
+
+try:
+    import resource
+except ImportError:
+    # Windows: pas de mesure du pic de mémoire
+    resource = None
+
+
+def peak_rss_bytes() -> int:
+    """Pic de mémoire résidente du processus courant (None si indisponible)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: kilo-octets, macOS: octets
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def channel_samples(segment) -> np.ndarray:
+    """
+    Échantillons int16 bruts d'un AudioSegment, une colonne par canal.
+    
+    Lus dans `raw_data` plutôt que via `sample_width`: le corpus et sa
+    reconstruction sont en 16 bits quel que soit le nombre de canaux.
+    """
+    return np.frombuffer(segment.raw_data, dtype='<i2').reshape(-1, segment.channels)
+
+
+def snr_db(reference: np.ndarray, reconstructed: np.ndarray) -> float:
+    """Rapport signal/bruit en dB sur la partie commune (None pour un signal nul ou parfait)"""
+    length = min(len(reference), len(reconstructed))
+    reference = reference[:length].astype(np.float64)
+    error = reference - reconstructed[:length]
+    signal_power = np.sum(reference ** 2)
+    noise_power = np.sum(error ** 2)
+    if signal_power == 0 or noise_power == 0:
+        return None
+    return float(10 * math.log10(signal_power / noise_power))
+
+
+# Plage de contrôle (ms): nombre impair de trames audio à 44,1 kHz
+RANGE_MS = (350, 1400)
+
+
+def measure(path: str, coder: str) -> dict:
+    """
+    Compresse et décompresse un fichier (exécuté dans un processus neuf).
+    
+    Chaque fichier est traité par un processus dédié pour que le pic de
+    mémoire mesuré soit le sien. Le SNR est calculé canal par canal sur les
+    échantillons int16; `snr_db` retient le canal le moins bon.
+    """
+    from pydub import AudioSegment
+    from compression.utils import taux_reduction
+    from core.compressor import AudioCompressor
+    
+    output = str(Path(path).with_suffix('.IRM'))
+    source = channel_samples(AudioSegment.from_file(path))
+    
+    start = time.perf_counter()
+    AudioCompressor.compress(path, output, coder=coder)
+    encode_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    decoded = AudioCompressor.decompress(output)
+    decode_seconds = time.perf_counter() - start
+    
+    # Une plage doit donner exactement les trames correspondantes du décodage complet
+    ranged = AudioCompressor.decompress(output, *RANGE_MS)
+    first = RANGE_MS[0] * decoded.frame_rate // 1000 * decoded.frame_width
+    range_match = ranged.raw_data == decoded.raw_data[first:first + len(ranged.raw_data)]
+    
+    reconstructed = channel_samples(decoded)
+    if reconstructed.shape[1] != source.shape[1]:
+        raise ValueError(f"{path}: {reconstructed.shape[1]} canaux décodés, {source.shape[1]} attendus")
+    channel_snr = [snr_db(source[:, channel], reconstructed[:, channel])
+                   for channel in range(source.shape[1])]
+    measured = [snr for snr in channel_snr if snr is not None]
+    
+    input_bytes = Path(path).stat().st_size
+    return {
+        'ratio': float(taux_reduction(path, output)),
+        'input_bytes': input_bytes,
+        'output_bytes': Path(output).stat().st_size,
+        'encode_seconds': encode_seconds,
+        'decode_seconds': decode_seconds,
+        'encode_mb_per_s': input_bytes / 1e6 / encode_seconds,
+        'decode_mb_per_s': input_bytes / 1e6 / decode_seconds,
+        'peak_rss_bytes': peak_rss_bytes(),
+        'snr_db': min(measured) if measured else None,
+        'snr_db_channels': channel_snr,
+        'range_match': range_match,
+    }
+
+
+def build_corpus(folder: Path, seconds: float) -> list:
+    """Écrit le corpus de référence (un WAV 16 bits par signal synthétique)"""
+    paths = []
+    for name, (generate, channels) in SIGNALS.items():
+        path = folder / f"{name}.wav"
+        write_wav(path, generate(seconds), channels, RATE)
+        paths.append(path)
+    return paths
+
+
+def check(report: dict, baseline: dict, args) -> list:
+    """
+    Compare le rapport aux seuils et au rapport de référence.
+    
+    Returns:
+        list: Descriptions des régressions (vide si tout passe)
+    """
+    failures = []
+    previous = {entry['file']: entry for entry in baseline['files']} if baseline else {}
+    for entry in report['files']:
+        name = entry['file']
+        if not entry['range_match']:
+            failures.append(f"{name}: la plage {RANGE_MS} ms diffère du décodage complet")
+        if args.min_ratio is not None and entry['ratio'] < args.min_ratio:
+            failures.append(f"{name}: taux {entry['ratio']}% < {args.min_ratio}%")
+        reference = previous.get(name)
+        if not reference:
+            continue
+        if entry['ratio'] < reference['ratio'] - args.max_ratio_drop:
+            failures.append(f"{name}: taux {entry['ratio']}% (référence {reference['ratio']}%)")
+        for key in ('encode_seconds', 'decode_seconds'):
+            if entry[key] > reference[key] * args.max_slowdown:
+                failures.append(f"{name}: {key} {entry[key]:.3f} s "
+                                f"(référence {reference[key]:.3f} s, max x{args.max_slowdown})")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Harnais de non-régression de bout en bout")
+    parser.add_argument('--seconds', type=float, default=20.0, help="durée des fichiers du corpus")
+    parser.add_argument('--coder', default='huffman', help="codeur entropique")
+    parser.add_argument('--output', help="rapport JSON")
+    parser.add_argument('--baseline', help="rapport JSON de référence (commit précédent)")
+    parser.add_argument('--min-ratio', type=float, default=None, help="taux de réduction minimal (%%)")
+    parser.add_argument('--max-ratio-drop', type=float, default=1.0,
+                        help="baisse de taux tolérée par rapport à la référence (points)")
+    parser.add_argument('--max-slowdown', type=float, default=1.5,
+                        help="ralentissement toléré par rapport à la référence (facteur)")
+    args = parser.parse_args()
+    
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'seconds': args.seconds,
+        'coder': args.coder,
+        'files': [],
+    }
+    print(f"{'fichier':12s} {'taux %':>7s} {'enc s':>7s} {'dec s':>7s} {'enc Mo/s':>9s} "
+          f"{'dec Mo/s':>9s} {'RSS Mo':>7s} {'SNR dB':>7s}")
+          
+    with tempfile.TemporaryDirectory() as folder:
+        for path in build_corpus(Path(folder), args.seconds):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+                entry = {'file': path.name, **executor.submit(measure, str(path), args.coder).result()}
+            report['files'].append(entry)
+            
+            rss = entry['peak_rss_bytes']
+            snr = entry['snr_db']
+            print(f"{entry['file']:12s} {entry['ratio']:7.2f} {entry['encode_seconds']:7.3f} "
+                  f"{entry['decode_seconds']:7.3f} {entry['encode_mb_per_s']:9.2f} "
+                  f"{entry['decode_mb_per_s']:9.2f} {rss / 1e6 if rss else float('nan'):7.1f} "
+                  f"{snr if snr is not None else float('nan'):7.2f}")
+                  
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Rapport écrit dans {args.output}")
+        
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+            
+    failures = check(report, baseline, args)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Aucune régression")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Signaux de test déterministes pour les bancs d'essai
+Même graine, mêmes échantillons: les mesures sont comparables entre commits
+"""
+
+import wave
+
+import numpy as np
+
+
+RATE = 44100
+
+
+def silence(seconds: float, rate: int = RATE) -> np.ndarray:
+    """Silence numérique (mono)"""
+    return np.zeros(int(seconds * rate), dtype=np.int16)
+
+
+def sweep(seconds: float, rate: int = RATE) -> np.ndarray:
+    """Balayage sinusoïdal logarithmique de 20 Hz à 20 kHz (mono)"""
+    t = np.arange(int(seconds * rate)) / rate
+    ratio = np.log(20000 / 20)
+    phase = 2 * np.pi * 20 * seconds / ratio * (np.exp(t / seconds * ratio) - 1)
+    return (12000 * np.sin(phase)).astype(np.int16)
+
+
+def noise(seconds: float, rate: int = RATE) -> np.ndarray:
+    """Bruit blanc gaussien (mono)"""
+    rng = np.random.default_rng(0)
+    return np.clip(8000 * rng.standard_normal(int(seconds * rate)), -32768, 32767).astype(np.int16)
+
+
+def speech(seconds: float, rate: int = RATE) -> np.ndarray:
+    """Salves harmoniques modulées séparées de silences bruités (mono)"""
+    rng = np.random.default_rng(1)
+    t = np.arange(int(seconds * rate)) / rate
+    pitch = 140 + 40 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 2.5 * t) * 1.5, 0, 1)
+    signal = 9000 * voiced * envelope + 60 * rng.standard_normal(len(t))
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def stereo(seconds: float, rate: int = RATE) -> np.ndarray:
+    """Stéréo réelle entrelacée [L,R,...]: accords différents et réverbération décalée"""
+    rng = np.random.default_rng(2)
+    t = np.arange(int(seconds * rate)) / rate
+    left = 6000 * np.sin(2 * np.pi * 220 * t) + 3000 * np.sin(2 * np.pi * 277 * t)
+    right = 6000 * np.sin(2 * np.pi * 330 * t) + 0.5 * np.roll(left, rate // 50)
+    left += 400 * rng.standard_normal(len(t))
+    right += 400 * rng.standard_normal(len(t))
+    interleaved = np.empty(2 * len(t), dtype=np.int16)
+    interleaved[0::2] = np.clip(left, -32768, 32767)
+    interleaved[1::2] = np.clip(right, -32768, 32767)
+    return interleaved
+
+
+# Générateur et nombre de canaux de chaque signal
+SIGNALS = {
+    'silence': (silence, 1),
+    'sweep': (sweep, 1),
+    'noise': (noise, 1),
+    'speech': (speech, 1),
+    'stereo': (stereo, 2),
+}
+
+
+def write_wav(path, samples: np.ndarray, channels: int, rate: int = RATE):
+    """Écrit des échantillons int16 entrelacés dans un fichier WAV"""
+    with wave.open(str(path), 'wb') as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(samples.astype('<i2').tobytes())
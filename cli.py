@@ -0,0 +1,290 @@
+"""
+Interface en ligne de commande (sans interface graphique)
+
+    python cli.py compress  entree.wav sortie.IRM [--coder huffman] [--workers 4]
+    python cli.py decompress entree.IRM sortie.wav [--start-ms 1000 --end-ms 5000]
+    python cli.py info      entree.IRM [--json]
+    python cli.py verify    entree.IRM ...
+    python cli.py bench     entree.wav [--coder huffman --coder rice]
+    python cli.py batch     dossier_audio dossier_irm [--workers 8]
+
+'-' désigne l'entrée ou la sortie standard. N'importe jamais PySide6; les
+modules de calcul ne sont importés que par la commande qui les utilise.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+
+STDIO = '-'
+
+# Codeurs entropiques (voir compression.entropy, non importé pour garder un démarrage rapide)
+CODERS = ['huffman', 'huffman-split', 'rans', 'rice']
+
+
+@contextlib.contextmanager
+def _input_file(path: str, suffix: str):
+    """Chemin lisible pour `path` ('-': copie de l'entrée standard dans un fichier temporaire)"""
+    if path != STDIO:
+        yield path
+        return
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        shutil.copyfileobj(sys.stdin.buffer, tmp)
+    try:
+        yield tmp.name
+    finally:
+        os.remove(tmp.name)
+
+
+@contextlib.contextmanager
+def _output_file(path: str, suffix: str):
+    """Chemin inscriptible pour `path` ('-': fichier temporaire recopié sur la sortie standard)"""
+    if path != STDIO:
+        yield path
+        return
+    fd, name = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        yield name
+        with open(name, 'rb') as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    finally:
+        os.remove(name)
+
+
+def _configure_logging(args):
+    """Messages de progression sur la sortie d'erreur (la sortie standard peut porter des données)"""
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stderr)
+    # Durée des étages (voir core.profiling) seulement avec -v
+    logging.getLogger('core.profiling').setLevel(
+        logging.DEBUG if args.verbose > 1 else logging.INFO if args.verbose else logging.WARNING)
+
+
+def cmd_compress(args) -> int:
+    from core.compressor import AudioCompressor
+
+    with _input_file(args.input, '.wav') as input_path, _output_file(args.output, '.IRM') as output_path:
+        stats = AudioCompressor.compress_stream(
+            input_path, output_path, coder=args.coder, frame_ms=args.frame_ms,
+            workers=args.workers, max_memory=args.max_memory)
+    if args.json:
+        print(json.dumps(stats), file=sys.stderr)
+    return 0
+
+
+def cmd_decompress(args) -> int:
+    from core.compressor import AudioCompressor
+
+    with _input_file(args.input, '.IRM') as input_path, _output_file(args.output, '.wav') as output_path:
+        AudioCompressor.decompress_to_wav(input_path, output_path, args.start_ms, args.end_ms,
+                                          workers=args.workers, stats={} if args.verbose else None)
+    return 0
+
+
+def cmd_info(args) -> int:
+    from core.container import map_file, read_info
+
+    with _input_file(args.input, '.IRM') as input_path:
+        with map_file(input_path) as buffer:
+            info = read_info(buffer)
+        info['size'] = os.path.getsize(input_path)
+
+    total = info['total_samples']
+    info['duration'] = (2 * total - 1 + (total % 2 == 0)) / info['framerate'] if total else 0.0
+
+    if args.json:
+        print(json.dumps(info))
+    else:
+        for key, value in info.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+def cmd_verify(args) -> int:
+    import struct
+    from core.container import map_file, verify
+
+    failures = 0
+    for input_path in args.inputs:
+        try:
+            with map_file(input_path) as buffer:
+                frames = verify(buffer)
+        except (ValueError, struct.error) as error:
+            print(f"❌ {input_path}: {error}", file=sys.stderr)
+            failures += 1
+        else:
+            logging.info("%s: %d trames intègres", input_path, frames)
+    return 1 if failures else 0
+
+
+def cmd_batch(args) -> int:
+    from core.batch import run_batch
+
+    # Messages de chaque fichier (core.compressor) seulement avec -v
+    if not args.verbose:
+        logging.getLogger('core.compressor').setLevel(logging.WARNING)
+    summary = run_batch(args.input_dir, args.output_dir, manifest_path=args.manifest,
+                        coder=args.coder, frame_ms=args.frame_ms, workers=args.workers)
+    if args.json:
+        print(json.dumps(summary))
+    return 1 if summary['failed'] else 0
+
+
+def cmd_bench(args) -> int:
+    import numpy as np
+    from compression.entropy import get_coder
+    from compression.encoding import delta_encode, delta_decode
+    from core.container import quantize_frame, dequantize_frame
+    from core.compressor import AudioCompressor
+    from core.pcm_stream import open_pcm_stream
+
+    coders = args.coder or ['huffman']
+    timings = {}
+
+    def timed(stage, function, *values):
+        start = time.perf_counter()
+        result = function(*values)
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+        return result
+
+    # Lecture, traitement stéréo et sous-échantillonnage
+    metadata, iter_blocks = open_pcm_stream(args.input)
+    blocks = timed('load', lambda: list(iter_blocks(1 << 16)))
+    samples = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int16)
+    channels = metadata['channels']
+    stereo_mode = timed('stereo', AudioCompressor.choose_stereo_mode, samples, channels)
+    lowered = timed('downsample', AudioCompressor.lower_block, samples, channels, stereo_mode)
+
+    frame_samples = max(1, args.frame_ms * metadata['framerate'] // 2000)
+    frames = [lowered[start:start + frame_samples] for start in range(0, len(lowered), frame_samples)]
+
+    # Étages communs à tous les codeurs
+    residual_frames = []
+    for frame in frames:
+        quantized, max_val, mean = timed('quantize', quantize_frame, frame)
+        residual_frames.append((timed('delta', delta_encode, quantized), max_val, mean))
+
+    # Codage entropique, par codeur
+    encoded_bytes = {}
+    for name in coders:
+        coder = get_coder(name)
+        encoded_bytes[name] = 0
+        for residuals, _, _ in residual_frames:
+            num_symbols, table, payload = timed(f'encode:{name}', coder.encode, residuals)
+            encoded_bytes[name] += len(table) + len(payload)
+            timed(f'decode:{name}', coder.decode, table, payload, num_symbols, len(residuals))
+
+    # Reconstruction
+    signals = []
+    for residuals, max_val, mean in residual_frames:
+        quantized = timed('delta-inverse', delta_decode, residuals)
+        signals.append(timed('dequantize', dequantize_frame, quantized, max_val, mean))
+    params = {'bits': metadata['sample_width'] * 8, 'channels': channels, 'total_samples': len(lowered)}
+    timed('interpolate', lambda: list(AudioCompressor.pcm_blocks(signals, params)))
+
+    report = {
+        'input': args.input,
+        'samples': int(len(samples)),
+        'lowered_samples': int(len(lowered)),
+        'frames': len(frames),
+        'stages': {stage: {'seconds': seconds,
+                           'msamples_per_s': len(lowered) / seconds / 1e6 if seconds else None}
+                   for stage, seconds in timings.items()},
+        'encoded_bytes': encoded_bytes,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.input}: {len(samples)} échantillons, {len(frames)} trames")
+    print(f"{'étage':<18}{'secondes':>10}{'Méch/s':>10}")
+    for stage, values in report['stages'].items():
+        rate = values['msamples_per_s'] or 0.0
+        print(f"{stage:<18}{values['seconds']:>10.4f}{rate:>10.2f}")
+    for name, size in encoded_bytes.items():
+        print(f"{name}: {size} octets (tables + flux)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(prog='cli.py', description="Compresseur audio .IRM (sans interface graphique)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="n'affiche pas la progression")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help="journalise la durée des étages (-vv: détail par étage)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    compress = commands.add_parser('compress', help="compresse un fichier audio en .IRM")
+    compress.add_argument('input', help="fichier audio ('-': entrée standard)")
+    compress.add_argument('output', help="fichier .IRM ('-': sortie standard)")
+    compress.add_argument('--coder', default='huffman', choices=CODERS)
+    compress.add_argument('--frame-ms', type=int, default=4000, help="durée d'une trame")
+    compress.add_argument('--workers', type=int, default=1, help="processus (0: tous les coeurs)")
+    compress.add_argument('--max-memory', type=int, default=64 * 1024 * 1024,
+                          help="mémoire de travail visée (octets)")
+    compress.add_argument('--json', action='store_true', help="statistiques JSON sur la sortie d'erreur")
+    compress.set_defaults(handler=cmd_compress)
+
+    decompress = commands.add_parser('decompress', help="décompresse un fichier .IRM en WAV")
+    decompress.add_argument('input', help="fichier .IRM ('-': entrée standard)")
+    decompress.add_argument('output', help="fichier WAV ('-': sortie standard)")
+    decompress.add_argument('--start-ms', type=int, default=None, help="début de la plage")
+    decompress.add_argument('--end-ms', type=int, default=None, help="fin de la plage (exclue)")
+    decompress.add_argument('--workers', type=int, default=1, help="processus (0: tous les coeurs)")
+    decompress.set_defaults(handler=cmd_decompress)
+
+    info = commands.add_parser('info', help="affiche les paramètres d'un fichier .IRM (en-têtes seulement)")
+    info.add_argument('input', help="fichier .IRM ('-': entrée standard)")
+    info.add_argument('--json', action='store_true')
+    info.set_defaults(handler=cmd_info)
+
+    verify = commands.add_parser('verify', help="vérifie l'intégrité de fichiers .IRM sans les décoder")
+    verify.add_argument('inputs', nargs='+', help="fichiers .IRM")
+    verify.set_defaults(handler=cmd_verify)
+
+    batch = commands.add_parser('batch', help="compresse tous les fichiers audio d'un dossier (reprise possible)")
+    batch.add_argument('input_dir', help="dossier des fichiers audio (parcouru récursivement)")
+    batch.add_argument('output_dir', help="dossier des fichiers .IRM")
+    batch.add_argument('--manifest', default=None, help="manifeste JSON Lines (défaut: output_dir/manifest.jsonl)")
+    batch.add_argument('--coder', default='huffman', choices=CODERS)
+    batch.add_argument('--frame-ms', type=int, default=4000, help="durée d'une trame")
+    batch.add_argument('--workers', type=int, default=0, help="processus (0: tous les coeurs)")
+    batch.add_argument('--json', action='store_true', help="bilan JSON sur la sortie standard")
+    batch.set_defaults(handler=cmd_batch)
+
+    bench = commands.add_parser('bench', help="temps de chaque étage sur un fichier audio")
+    bench.add_argument('input', help="fichier audio")
+    bench.add_argument('--coder', action='append', choices=CODERS,
+                       help="codeur à mesurer (répétable, défaut: huffman)")
+    bench.add_argument('--frame-ms', type=int, default=4000, help="durée d'une trame")
+    bench.add_argument('--json', action='store_true')
+    bench.set_defaults(handler=cmd_bench)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    _configure_logging(args)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError, RuntimeError) as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,187 +3,684 @@ Module d'encodage audio
 Implémente Delta Encoding, RLE et Huffman pour la compression
 """
 
+import struct
 import numpy as np
-from bitarray import bitarray
-from collections import Counter
-import heapq
+from bitarray import bitarray, decodetree
+from bitarray.util import int2ba
+from itertools import islice
 
 
-def delta_encode(signal: np.ndarray) -> np.ndarray:
+# Longueur maximale des codes de Huffman (les codes tiennent dans un uint32)
+MAX_CODE_LENGTH = 32
+
+# Longueur de séquence à partir de laquelle le mode séparé utilise un échappement
+RUN_ESCAPE = 64
+
+# Nombre de résidus partageant un même paramètre de Rice
+RICE_BLOCK_SIZE = 4096
+
+# Paramètre k réservé aux blocs entièrement nuls (silence): aucun bit écrit
+RICE_ZERO_BLOCK = 0xFF
+
+# bitarray < 3.0 expose iterdecode(), bitarray >= 3.0 renvoie un itérateur via decode()
+_iterdecode = getattr(bitarray, 'iterdecode', bitarray.decode)
+
+
+def delta_encode(signal: np.ndarray, dtype=np.int16) -> np.ndarray:
     """
     Encode le signal avec Delta encoding (stocke les différences).
     
     Au lieu de stocker [100, 102, 101, 103], on stocke [100, 2, -1, 2].
     Les différences sont généralement plus petites et plus compressibles.
     
+    Le calcul est vectorisé (une seule passe NumPy). Les résidus sont
+    calculés dans `dtype`: avec un type au moins deux fois plus large que
+    celui du signal, aucun débordement n'est possible. Avec le type par
+    défaut (int16), le comportement historique est conservé à l'identique
+    (arithmétique modulo 2^16).
+    
     Args:
         signal: Signal audio à encoder
+        dtype: Type des résidus (par défaut int16)
         
     Returns:
         np.ndarray: Résidus (différences entre échantillons consécutifs)
     """
-    residuals = np.zeros_like(signal, dtype=np.int16)
-    residuals[0] = signal[0]
-    for i in range(1, len(signal)):
-        residuals[i] = signal[i] - signal[i - 1]
+    signal = np.asarray(signal)
+    residuals = np.empty(len(signal), dtype=dtype)
+    if len(signal) == 0:
+        return residuals
+    
+    wide = signal.astype(np.int64, copy=False)
+    residuals[0] = wide[0]
+    residuals[1:] = np.diff(wide).astype(dtype, copy=False)
     return residuals
 
 
-def delta_decode(residuals: np.ndarray) -> np.ndarray:
+def delta_decode(residuals: np.ndarray, dtype=np.int16) -> np.ndarray:
     """
     Décode les résidus Delta pour reconstruire le signal.
     
+    Somme cumulée vectorisée, accumulée dans `dtype` (même sémantique de
+    débordement que l'encodeur).
+    
     Args:
         residuals: Résidus Delta
+        dtype: Type du signal reconstruit (par défaut int16)
         
     Returns:
         np.ndarray: Signal original reconstruit
     """
-    signal = np.zeros_like(residuals, dtype=np.int16)
-    signal[0] = residuals[0]
-    for i in range(1, len(signal)):
-        signal[i] = signal[i - 1] + residuals[i]
-    return signal
+    return np.cumsum(residuals, dtype=dtype)
 
 
-def rle_encode(residuals: np.ndarray) -> list:
+def rle_encode(residuals: np.ndarray, max_count: int = 32767) -> tuple:
     """
     Encode avec RLE (Run-Length Encoding).
     
-    Compresse les répétitions: [5,5,5,5,7,7] -> [(5,4), (7,2)]
+    Compresse les répétitions: [5,5,5,5,7,7] -> valeurs [5, 7], nombres [4, 2]
+    
+    Représentation en colonnes: deux tableaux NumPy parallèles obtenus par
+    détection des frontières de séquences. Les séquences plus longues que
+    `max_count` sont découpées (limite int16 historique).
     
     Args:
         residuals: Résidus Delta
+        max_count: Longueur maximale d'une séquence
         
     Returns:
-        list: Liste de tuples (valeur, nombre_répétitions)
+        tuple: (valeurs, nombres_répétitions) sous forme de np.ndarray
     """
+    residuals = np.asarray(residuals)
     if len(residuals) == 0:
-        return []
+        return residuals[:0].copy(), np.zeros(0, dtype=np.int64)
     
-    rle_data = []
-    current_value = residuals[0]
-    count = 1
+    starts = np.flatnonzero(residuals[1:] != residuals[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+    values = residuals[starts]
+    counts = np.diff(np.append(starts, len(residuals)))
     
-    for value in residuals[1:]:
-        if value == current_value and count < 32767:  # Limite int16
-            count += 1
-        else:
-            rle_data.append((current_value, count))
-            current_value = value
-            count = 1
+    if counts.max() > max_count:
+        # Découpe des longues séquences en blocs de max_count
+        chunks = (counts + max_count - 1) // max_count
+        last = np.cumsum(chunks) - 1
+        values = np.repeat(values, chunks)
+        split_counts = np.full(len(values), max_count, dtype=counts.dtype)
+        split_counts[last] = counts - (chunks - 1) * max_count
+        counts = split_counts
     
-    rle_data.append((current_value, count))
-    return rle_data
+    return values, counts
 
 
-def rle_decode(rle_data: list, total_length: int) -> np.ndarray:
+def rle_decode(values: np.ndarray, counts: np.ndarray, total_length: int) -> np.ndarray:
     """
     Décode les données RLE.
     
     Args:
-        rle_data: Liste de tuples (valeur, nombre)
+        values: Valeurs des séquences
+        counts: Nombre de répétitions de chaque valeur
         total_length: Longueur totale attendue
         
     Returns:
         np.ndarray: Résidus décompressés
     """
-    residuals = []
-    for value, count in rle_data:
-        residuals.extend([value] * count)
-    return np.array(residuals[:total_length], dtype=np.int16)
+    residuals = np.repeat(np.asarray(values, dtype=np.int16), counts)
+    return residuals[:total_length]
 
 
-def build_huffman_tree(frequencies):
+def pack_rle_symbols(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
     """
-    Construit l'arbre de Huffman à partir des fréquences.
+    Regroupe chaque paire RLE en une clé entière de largeur fixe.
+    
+    clé = (valeur << 16) | nombre, avec valeur sur 16 bits signés et nombre
+    sur 16 bits non signés: la clé tient dans un int32 et l'ordre des clés
+    suit celui des valeurs.
+    
+    Args:
+        values: Valeurs des séquences RLE (int16)
+        counts: Nombre de répétitions (1..65535)
+        
+    Returns:
+        np.ndarray: Clés (int64)
+    """
+    return (np.asarray(values, dtype=np.int64) << 16) | np.asarray(counts, dtype=np.int64)
+
+
+def unpack_rle_symbols(keys: np.ndarray) -> tuple:
+    """
+    Sépare des clés produites par `pack_rle_symbols`.
     
     Args:
-        frequencies: Dictionnaire {symbole: fréquence}
+        keys: Clés entières
         
     Returns:
-        list: Arbre de Huffman
+        tuple: (valeurs int16, nombres int64)
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    return (keys >> 16).astype(np.int16), keys & 0xFFFF
+
+
+def huffman_code_lengths(weights: np.ndarray, max_length: int = None) -> np.ndarray:
     """
-    heap = [[weight, [symbol, ""]] for symbol, weight in frequencies.items()]
-    heapq.heapify(heap)
+    Calcule les longueurs des codes de Huffman à partir des fréquences.
+    
+    Méthode des deux files: les feuilles sont triées une fois par poids, et
+    les noeuds internes sont créés dans l'ordre croissant de poids, donc la
+    file des noeuds internes reste triée sans tas. Chaque noeud ne stocke
+    que l'indice de son parent; la profondeur des feuilles est obtenue en
+    une passe de la racine vers les feuilles. Coût total O(n log n) (tri)
+    quel que soit la taille de l'alphabet.
     
-    while len(heap) > 1:
-        lo = heapq.heappop(heap)
-        hi = heapq.heappop(heap)
+    Si `max_length` est donné et dépassé, les poids sont divisés par deux
+    (en restant >= 1) jusqu'à ce que le code le respecte.
+    
+    Args:
+        weights: Fréquence de chaque symbole
+        max_length: Longueur maximale autorisée d'un code (optionnel)
         
-        for pair in lo[1:]:
-            pair[1] = '0' + pair[1]
-        for pair in hi[1:]:
-            pair[1] = '1' + pair[1]
-            
-        heapq.heappush(heap, [lo[0] + hi[0]] + lo[1:] + hi[1:])
+    Returns:
+        np.ndarray: Longueur du code de chaque symbole (même ordre que weights)
+        
+    Raises:
+        ValueError: Si l'alphabet ne peut pas tenir dans max_length bits
+    """
+    weights = np.asarray(weights, dtype=np.int64)
+    num_leaves = len(weights)
+    if num_leaves <= 1:
+        # Alphabet vide ou d'un seul symbole: code vide
+        return np.zeros(num_leaves, dtype=np.int64)
+    if max_length is not None and num_leaves > (1 << max_length):
+        raise ValueError(f"{num_leaves} symboles ne tiennent pas sur {max_length} bits")
     
-    return sorted(heap[0][1:], key=lambda p: (len(p[-1]), p))
+    while True:
+        lengths = _two_queue_lengths(weights)
+        if max_length is None or lengths.max() <= max_length:
+            return lengths
+        weights = (weights + 1) // 2
 
 
-def generate_huffman_codes(tree):
+def _two_queue_lengths(weights: np.ndarray) -> np.ndarray:
+    """Longueurs de Huffman par la méthode des deux files (au moins 2 symboles)."""
+    num_leaves = len(weights)
+    order = np.argsort(weights, kind='stable')
+    leaf_weights = weights[order].tolist()
+    node_weights = []
+    parent = [0] * (2 * num_leaves - 1)
+    
+    leaf = internal = 0
+    for node in range(num_leaves, 2 * num_leaves - 1):
+        children_weight = 0
+        for _ in range(2):
+            # À poids égal, la feuille est prise en premier (arbre moins profond)
+            if internal >= len(node_weights) or (
+                    leaf < num_leaves and leaf_weights[leaf] <= node_weights[internal]):
+                parent[leaf] = node
+                children_weight += leaf_weights[leaf]
+                leaf += 1
+            else:
+                parent[num_leaves + internal] = node
+                children_weight += node_weights[internal]
+                internal += 1
+        node_weights.append(children_weight)
+    
+    # Les parents ont toujours un indice plus grand: parcours décroissant
+    depth = [0] * (2 * num_leaves - 1)
+    for node in range(2 * num_leaves - 3, -1, -1):
+        depth[node] = depth[parent[node]] + 1
+    
+    lengths = np.empty(num_leaves, dtype=np.int64)
+    lengths[order] = depth[:num_leaves]
+    return lengths
+
+
+def canonical_huffman_codes(lengths: np.ndarray) -> np.ndarray:
     """
-    Génère les codes de Huffman à partir de l'arbre.
+    Calcule les codes de Huffman canoniques à partir des longueurs.
+    
+    Les symboles doivent être donnés dans l'ordre canonique (longueur
+    croissante). Le code de chaque symbole ne dépend que de cet ordre et
+    des longueurs: le décodeur reconstruit donc exactement les mêmes codes
+    sans que ceux-ci soient stockés (même principe que DEFLATE).
     
     Args:
-        tree: Arbre de Huffman
+        lengths: Longueur du code de chaque symbole, en ordre canonique
         
     Returns:
-        dict: {symbole: code_binaire}
+        np.ndarray: Codes (entiers) de chaque symbole
     """
-    return {symbol: code for symbol, code in tree}
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if len(lengths) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    
+    length_counts = np.bincount(lengths, minlength=int(lengths.max()) + 1)
+    length_counts[0] = 0
+    
+    # Premier code de chaque longueur
+    first_code = np.zeros(len(length_counts), dtype=np.uint64)
+    code = 0
+    for length in range(1, len(length_counts)):
+        code = (code + int(length_counts[length - 1])) << 1
+        first_code[length] = code
+    
+    # Rang du symbole parmi ceux de même longueur
+    group_start = np.cumsum(length_counts) - length_counts
+    rank = np.arange(len(lengths)) - group_start[lengths]
+    return first_code[lengths] + rank.astype(np.uint64)
 
 
-def huffman_encode_rle(rle_data: list) -> tuple:
+def pack_huffman_table(symbols: np.ndarray, lengths: np.ndarray) -> bytes:
     """
-    Encode les paires RLE avec Huffman.
+    Sérialise une table de Huffman canonique.
     
-    Assigne des codes courts aux paires fréquentes, codes longs aux rares.
+    Format (big-endian): nombre de symboles (I), longueur maximale (B),
+    nombre de codes par longueur (I × longueur maximale), puis les symboles
+    (int32) en ordre canonique, octet de poids fort de tous les symboles
+    d'abord (plans d'octets, mieux compressés par zlib). Les codes eux-mêmes
+    ne sont pas stockés.
     
     Args:
-        rle_data: Liste de tuples (valeur, nombre)
+        symbols: Symboles entiers en ordre canonique
+        lengths: Longueur du code de chaque symbole
         
     Returns:
-        tuple: (bitarray_encodé, dictionnaire_codes)
+        bytes: Table sérialisée
     """
-    # Convertit les tuples en symboles string
-    symbols = [f"{value},{count}" for value, count in rle_data]
-    frequencies = Counter(symbols)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    max_length = int(lengths.max()) if len(lengths) else 0
+    length_counts = np.bincount(lengths, minlength=max_length + 1)[1:]
     
-    tree = build_huffman_tree(frequencies)
-    codes = generate_huffman_codes(tree)
+    return b''.join([
+        struct.pack('!IB', len(lengths), max_length),
+        length_counts.astype('>u4').tobytes(),
+        np.asarray(symbols).astype('>i4').view(np.uint8).reshape(-1, 4).T.tobytes(),
+    ])
+
+
+def unpack_huffman_table(data: bytes) -> tuple:
+    """
+    Relit une table de Huffman canonique sérialisée par `pack_huffman_table`.
     
+    Args:
+        data: Table sérialisée
+        
+    Returns:
+        tuple: (symboles, longueurs) en ordre canonique
+        
+    Raises:
+        ValueError: Si la table est tronquée ou ne décrit pas un code préfixe
+    """
+    if len(data) < 5:
+        raise ValueError("Table de Huffman tronquée")
+    num_symbols, max_length = struct.unpack_from('!IB', data)
+    expected = 5 + 4 * max_length + 4 * num_symbols
+    if len(data) != expected:
+        raise ValueError("Table de Huffman de taille invalide")
+    
+    length_counts = np.frombuffer(data, dtype='>u4', count=max_length, offset=5).astype(np.int64)
+    planes = np.frombuffer(data, dtype=np.uint8, count=4 * num_symbols, offset=5 + 4 * max_length)
+    symbols = planes.reshape(4, num_symbols).T.copy().view('>i4').reshape(-1).astype(np.int64)
+    
+    if num_symbols == 1 and max_length == 0:
+        # Alphabet d'un seul symbole: code vide
+        return symbols, np.zeros(1, dtype=np.int64)
+    
+    if length_counts.sum() != num_symbols:
+        raise ValueError("Table de Huffman incohérente")
+    lengths = np.repeat(np.arange(1, max_length + 1), length_counts)
+    if np.sum(np.ldexp(1.0, -lengths)) > 1.0:
+        raise ValueError("Les longueurs ne décrivent pas un code préfixe")
+    
+    return symbols, lengths
+
+
+def pack_codes(codes: np.ndarray, lengths: np.ndarray, chunk_size: int = 65536) -> bitarray:
+    """
+    Concatène des mots de code entiers en un flux de bits (MSB en premier).
+    
+    Chaque symbole i produit les `lengths[i]` bits de poids faible de
+    `codes[i]`. Les bits sont extraits par blocs avec des opérations NumPy
+    puis regroupés en octets avec np.packbits: aucun appel Python par symbole.
+    
+    Args:
+        codes: Mots de code (entiers)
+        lengths: Longueur en bits de chaque mot de code
+        chunk_size: Nombre de symboles traités par bloc (borne la mémoire)
+        
+    Returns:
+        bitarray: Flux de bits de longueur sum(lengths)
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
     encoded = bitarray()
-    for symbol in symbols:
-        encoded.extend(codes[symbol])
+    if len(lengths) == 0 or lengths.max() == 0:
+        return encoded
+    
+    max_length = int(lengths.max())
+    word = np.uint32 if max_length <= 32 else np.uint64
+    codes = np.asarray(codes).astype(word, copy=False)
+    # Rang de chaque colonne de bits, du poids fort au poids faible
+    shifts = np.arange(max_length - 1, -1, -1).astype(word)
+    
+    pieces = []
+    for start in range(0, len(codes), chunk_size):
+        chunk_codes = codes[start:start + chunk_size]
+        chunk_lengths = lengths[start:start + chunk_size].astype(word)
+        bits = ((chunk_codes[:, None] >> shifts) & word(1)).astype(np.uint8)
+        # Seules les `longueur` dernières colonnes appartiennent au code
+        pieces.append(bits[shifts < chunk_lengths[:, None]])
     
-    return encoded, codes
+    encoded.frombytes(np.packbits(np.concatenate(pieces)).tobytes())
+    del encoded[int(lengths.sum()):]
+    return encoded
 
 
-def huffman_decode_rle(encoded_bits: bitarray, huffman_codes: dict, total_pairs: int) -> list:
+def huffman_encode_symbols(symbols: np.ndarray, max_length: int = MAX_CODE_LENGTH) -> tuple:
+    """
+    Encode un flux de symboles entiers avec un code de Huffman canonique.
+    
+    L'histogramme est calculé par np.unique (comptage vectorisé). Seules
+    les longueurs de l'arbre sont conservées: les codes sont ensuite
+    réattribués de façon canonique, ce qui permet de ne stocker que la
+    table (symbole, longueur). Tous les bits sont écrits en bloc par
+    `pack_codes`.
+    
+    Args:
+        symbols: Flux de symboles entiers
+        max_length: Longueur maximale d'un code
+        
+    Returns:
+        tuple: (bitarray_encodé, (symboles, longueurs) en ordre canonique)
+    """
+    alphabet, inverse, weights = np.unique(symbols, return_inverse=True, return_counts=True)
+    
+    lengths = huffman_code_lengths(weights, max_length)
+    
+    # Ordre canonique: longueur croissante puis symbole croissant
+    order = np.lexsort((alphabet, lengths))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    codes = canonical_huffman_codes(lengths[order])
+    
+    symbol_index = rank[inverse.reshape(-1)]
+    encoded = pack_codes(codes[symbol_index], lengths[order][symbol_index])
+    return encoded, (alphabet[order], lengths[order])
+
+
+def huffman_decode_symbols(encoded_bits: bitarray, codebook: tuple, total_symbols: int) -> np.ndarray:
+    """
+    Décode un flux de bits Huffman vers des symboles entiers.
+    
+    Les codes canoniques sont recalculés à partir des longueurs, puis
+    l'arbre de décodage est construit une seule fois (`decodetree`) et le
+    parcours du flux est fait en C par bitarray: chaque mot de code est
+    résolu en une recherche, et le décodeur produit directement l'indice
+    entier du symbole.
+    
+    Args:
+        encoded_bits: Flux de bits encodé
+        codebook: Table (symboles, longueurs) en ordre canonique
+        total_symbols: Nombre de symboles attendus
+        
+    Returns:
+        np.ndarray: Symboles décodés (int64)
+        
+    Raises:
+        ValueError: Si le flux contient moins de `total_symbols` symboles
+    """
+    symbols, lengths = codebook
+    symbols = np.asarray(symbols, dtype=np.int64)
+    
+    if len(lengths) == 1:
+        # Alphabet d'un seul symbole: code vide, aucun bit à lire
+        return np.full(total_symbols, symbols[0], dtype=np.int64)
+    
+    codes = canonical_huffman_codes(lengths)
+    tree = decodetree({i: int2ba(int(code), int(length))
+                       for i, (code, length) in enumerate(zip(codes, lengths))})
+    # islice s'arrête avant les bits de bourrage de fin d'octet
+    indices = np.fromiter(islice(_iterdecode(encoded_bits, tree), total_symbols), dtype=np.intp)
+    if len(indices) != total_symbols:
+        raise ValueError(f"Flux Huffman tronqué: {len(indices)} symboles sur {total_symbols}")
+    return symbols[indices]
+
+
+def huffman_encode_rle(values: np.ndarray, counts: np.ndarray) -> tuple:
+    """
+    Encode les paires RLE avec Huffman.
+    
+    Assigne des codes courts aux paires fréquentes, codes longs aux rares.
+    Chaque paire est un symbole entier (voir `pack_rle_symbols`).
+    
+    Args:
+        values: Valeurs des séquences RLE
+        counts: Nombre de répétitions de chaque valeur
+        
+    Returns:
+        tuple: (bitarray_encodé, table (clés, longueurs) en ordre canonique)
+    """
+    return huffman_encode_symbols(pack_rle_symbols(values, counts))
+
+
+def huffman_decode_rle(encoded_bits: bitarray, codebook, total_pairs: int) -> tuple:
     """
     Décode le flux de bits Huffman vers des paires RLE.
     
     Args:
         encoded_bits: Flux de bits encodé
-        huffman_codes: Dictionnaire de codes Huffman
+        codebook: Table (clés, longueurs) en ordre canonique, ou
+                  dictionnaire {"valeur,nombre": code binaire} des fichiers d'origine
+        total_pairs: Nombre total de paires attendues
+        
+    Returns:
+        tuple: (valeurs, nombres_répétitions) sous forme de np.ndarray
+    """
+    if isinstance(codebook, dict):
+        return legacy_huffman_decode_rle(encoded_bits, codebook, total_pairs)
+    return unpack_rle_symbols(huffman_decode_symbols(encoded_bits, codebook, total_pairs))
+
+
+def legacy_huffman_decode_rle(encoded_bits: bitarray, huffman_codes: dict, total_pairs: int) -> tuple:
+    """
+    Décode un flux Huffman des fichiers d'origine (table {"valeur,nombre": "0101..."}).
+    
+    Les codes étaient stockés explicitement, sous forme de chaînes: ils
+    sont convertis une fois en arbre de décodage, puis le flux est parcouru
+    par bitarray comme pour les tables canoniques.
+    
+    Args:
+        encoded_bits: Flux de bits encodé
+        huffman_codes: Dictionnaire {symbole: code binaire}
+        total_pairs: Nombre total de paires attendues
+        
+    Returns:
+        tuple: (valeurs int16, nombres_répétitions int64)
+        
+    Raises:
+        ValueError: Si la table est vide, mal formée ou n'est pas un code préfixe
+    """
+    if not huffman_codes:
+        raise ValueError("Table de Huffman vide")
+    try:
+        pairs = np.array([[int(part) for part in symbol.split(',')] for symbol in huffman_codes],
+                         dtype=np.int64).reshape(len(huffman_codes), 2)
+        if len(huffman_codes) == 1:
+            # Alphabet d'un seul symbole: code vide, aucun bit à lire
+            indices = np.zeros(total_pairs, dtype=np.intp)
+        else:
+            tree = decodetree({i: bitarray(code) for i, code in enumerate(huffman_codes.values())})
+            # islice s'arrête avant les bits de bourrage de fin d'octet
+            indices = np.fromiter(islice(_iterdecode(encoded_bits, tree), total_pairs), dtype=np.intp)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Table de Huffman d'origine invalide: {error}") from error
+    return pairs[indices, 0].astype(np.int16), pairs[indices, 1]
+
+
+def split_encode_rle(values: np.ndarray, counts: np.ndarray, escape: int = RUN_ESCAPE) -> tuple:
+    """
+    Encode les paires RLE avec deux modèles séparés (valeurs / longueurs).
+    
+    Au lieu d'un symbole par paire (valeur, nombre), les valeurs et les
+    longueurs de séquence forment deux flux avec chacun sa petite table de
+    Huffman. Les longueurs >= `escape` sont codées par le symbole
+    d'échappement `escape` suivi de la longueur brute sur 16 bits, dans un
+    troisième segment.
+    
+    Flux produit: [bits des valeurs][bits des longueurs][longueurs brutes]
+    
+    Args:
+        values: Valeurs des séquences RLE
+        counts: Nombre de répétitions de chaque valeur
+        escape: Longueur à partir de laquelle on utilise l'échappement
+        
+    Returns:
+        tuple: (bitarray_encodé, tables sérialisées)
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    value_bits, value_codebook = huffman_encode_symbols(values)
+    run_bits, run_codebook = huffman_encode_symbols(np.minimum(counts, escape))
+    
+    escaped = counts[counts >= escape]
+    escape_bits = pack_codes(escaped, np.full(len(escaped), 16))
+    
+    value_table = pack_huffman_table(*value_codebook)
+    tables = b''.join([
+        struct.pack('!HIII', escape, len(value_bits), len(run_bits), len(value_table)),
+        value_table,
+        pack_huffman_table(*run_codebook),
+    ])
+    return value_bits + run_bits + escape_bits, tables
+
+
+def split_decode_rle(encoded_bits: bitarray, tables: bytes, total_pairs: int) -> tuple:
+    """
+    Décode un flux produit par `split_encode_rle`.
+    
+    Args:
+        encoded_bits: Flux de bits encodé
+        tables: Tables sérialisées
         total_pairs: Nombre total de paires attendues
         
     Returns:
-        list: Liste de tuples (valeur, nombre)
+        tuple: (valeurs, nombres_répétitions) sous forme de np.ndarray
     """
-    code_to_symbol = {code: symbol for symbol, code in huffman_codes.items()}
-    decoded = []
-    current_code = ''
+    escape, value_size, run_size, table_size = struct.unpack_from('!HIII', tables)
+    value_codebook = unpack_huffman_table(tables[14:14 + table_size])
+    run_codebook = unpack_huffman_table(tables[14 + table_size:])
+    
+    values = huffman_decode_symbols(encoded_bits[:value_size], value_codebook, total_pairs)
+    run_end = value_size + run_size
+    counts = huffman_decode_symbols(encoded_bits[value_size:run_end], run_codebook, total_pairs)
+    
+    escaped = counts == escape
+    num_escaped = int(np.count_nonzero(escaped))
+    if num_escaped:
+        raw = encoded_bits[run_end:run_end + 16 * num_escaped].tobytes()
+        counts[escaped] = np.frombuffer(raw, dtype='>u2', count=num_escaped)
+    
+    return values.astype(np.int16), counts
+
+
+def rice_encode(residuals: np.ndarray, block_size: int = RICE_BLOCK_SIZE) -> tuple:
+    """
+    Encode les résidus Delta avec un code de Golomb-Rice adaptatif par bloc.
+    
+    Mode rapide: ni RLE, ni histogramme, ni arbre. Les résidus sont repliés
+    en entiers positifs (zigzag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...),
+    puis chaque bloc de `block_size` résidus reçoit son paramètre k estimé
+    à partir de sa moyenne. Chaque valeur u s'écrit u >> k en unaire suivi
+    des k bits de poids faible.
+    
+    Les parties unaires et les restes forment deux flux séparés, ce qui
+    rend l'encodage et le décodage entièrement vectorisés: les fins de
+    codes unaires sont simplement les bits à 0 du premier flux.
+    
+    Un bloc entièrement nul reçoit k = RICE_ZERO_BLOCK et n'écrit aucun
+    bit (sinon le silence coûterait un bit unaire par résidu).
+    
+    Args:
+        residuals: Résidus Delta
+        block_size: Nombre de résidus par bloc
+        
+    Returns:
+        tuple: (paramètres sérialisés, flux encodé)
+    """
+    wide = np.asarray(residuals, dtype=np.int64)
+    unsigned = (wide << 1) ^ (wide >> 63)
+    
+    starts = np.arange(0, len(unsigned), block_size)
+    block_lengths = np.diff(np.append(starts, len(unsigned)))
+    if len(starts):
+        means = np.add.reduceat(unsigned, starts) / block_lengths
+    else:
+        means = np.zeros(0)
+    block_k = np.clip(np.ceil(np.log2(means + 1)) - 1, 0, 15).astype(np.uint8)
+    k = np.repeat(block_k.astype(np.int64), block_lengths)
+    
+    zero_blocks = means == 0
+    if zero_blocks.any():
+        block_k[zero_blocks] = RICE_ZERO_BLOCK
+        coded = np.repeat(~zero_blocks, block_lengths)
+        unsigned, k = unsigned[coded], k[coded]
+        
+    quotients = unsigned >> k
+    unary = np.ones(int(quotients.sum()) + len(quotients), dtype=np.uint8)
+    unary[np.cumsum(quotients + 1) - 1] = 0
+    unary_bytes = np.packbits(unary).tobytes()
+    
+    remainders = pack_codes(unsigned & ((1 << k) - 1), k)
+    
+    params = struct.pack('!II', block_size, len(unary_bytes)) + block_k.tobytes()
+    return params, unary_bytes + remainders.tobytes()
+
+
+def rice_decode(params: bytes, payload: bytes, length: int) -> np.ndarray:
+    """
+    Décode un flux produit par `rice_encode`.
+    
+    Args:
+        params: Paramètres sérialisés (taille de bloc, k de chaque bloc)
+        payload: Flux encodé
+        length: Nombre de résidus attendus
+        
+    Returns:
+        np.ndarray: Résidus Delta (int16)
+        
+    Raises:
+        ValueError: Si le flux est tronqué
+    """
+    block_size, unary_size = struct.unpack_from('!II', params)
+    block_k = np.frombuffer(params, dtype=np.uint8, offset=8).astype(np.int64)
+    block_lengths = np.full(len(block_k), block_size, dtype=np.int64)
+    if len(block_lengths):
+        block_lengths[-1] = length - block_size * (len(block_k) - 1)
+        
+    # Les blocs nuls n'ont rien dans le flux
+    zero_blocks = block_k == RICE_ZERO_BLOCK
+    coded = np.repeat(~zero_blocks, block_lengths) if zero_blocks.any() else None
+    k = np.repeat(block_k[~zero_blocks], block_lengths[~zero_blocks])
+    num_coded = len(k)
+    
+    payload = np.frombuffer(payload, dtype=np.uint8)
+    unary = np.unpackbits(payload[:unary_size])
+    ends = np.flatnonzero(unary == 0)[:num_coded]
+    if len(ends) < num_coded:
+        raise ValueError("Flux Rice tronqué")
+    quotients = np.diff(ends, prepend=-1) - 1
     
-    for bit in encoded_bits:
-        current_code += '1' if bit else '0'
-        if current_code in code_to_symbol:
-            symbol = code_to_symbol[current_code]
-            value, count = map(int, symbol.split(','))
-            decoded.append((value, count))
-            current_code = ''
-        if len(decoded) >= total_pairs:
-            break
+    # Chaque reste (k <= 15 bits) tient dans la fenêtre de 32 bits qui
+    # commence à l'octet contenant son premier bit
+    remainder_bytes = np.concatenate([payload[unary_size:], np.zeros(4, dtype=np.uint8)]).astype(np.uint32)
+    positions = np.cumsum(k) - k
+    if len(k) and (positions[-1] + k[-1] + 7) // 8 > len(remainder_bytes) - 4:
+        raise ValueError("Flux Rice tronqué")
+    first = positions >> 3
+    windows = ((remainder_bytes[first] << 24) | (remainder_bytes[first + 1] << 16)
+               | (remainder_bytes[first + 2] << 8) | remainder_bytes[first + 3]).astype(np.int64)
+    remainders = (windows >> (32 - (positions & 7) - k)) & ((1 << k) - 1)
     
-    return decoded
\ No newline at end of file
+    unsigned = (quotients << k) | remainders
+    residuals = ((unsigned >> 1) ^ -(unsigned & 1)).astype(np.int16)
+    if coded is None:
+        return residuals
+    full = np.zeros(length, dtype=np.int16)
+    full[coded] = residuals
+    return full
@@ -0,0 +1,211 @@
+"""
+Module des codeurs entropiques
+Interface commune et registre des backends (Huffman, Huffman séparé, rANS, Rice)
+"""
+
+import struct
+import numpy as np
+from bitarray import bitarray
+
+from .encoding import (
+    rle_encode, rle_decode, huffman_encode_rle, huffman_decode_rle,
+    pack_rle_symbols, unpack_rle_symbols, pack_huffman_table, unpack_huffman_table,
+    split_encode_rle, split_decode_rle, rice_encode, rice_decode
+)
+from .rans import rans_encode, rans_decode, AlphabetTooLarge
+
+
+class EntropyCoder:
+    """
+    Interface d'un codeur entropique.
+    
+    Un codeur transforme les résidus Delta en (nombre de symboles, table,
+    flux) et inversement. `name` sert à le choisir dans AudioCompressor,
+    `coder_id` est l'octet enregistré dans le fichier.
+    """
+    
+    name = None
+    coder_id = None
+    
+    @staticmethod
+    def encode(residuals: np.ndarray) -> tuple:
+        """
+        Encode les résidus Delta.
+        
+        Args:
+            residuals: Résidus Delta (int16)
+            
+        Returns:
+            tuple: (nombre_symboles, table: bytes, flux: bytes)
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def decode(table: bytes, payload: bytes, num_symbols: int, length: int) -> np.ndarray:
+        """
+        Décode les résidus Delta.
+        
+        Args:
+            table: Table sérialisée
+            payload: Flux encodé
+            num_symbols: Nombre de symboles encodés
+            length: Nombre de résidus attendus
+            
+        Returns:
+            np.ndarray: Résidus Delta (int16)
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def table_symbols(table: bytes) -> int:
+        """
+        Nombre de symboles décrits par une table (lu dans son en-tête).
+        
+        Args:
+            table: Table sérialisée rendue par `encode`
+            
+        Returns:
+            int: Taille de l'alphabet du codeur (0 sans table de symboles)
+        """
+        raise NotImplementedError
+
+
+class HuffmanCoder(EntropyCoder):
+    """RLE puis Huffman canonique sur les paires (valeur, nombre)"""
+    
+    name = 'huffman'
+    coder_id = 0
+    
+    @staticmethod
+    def encode(residuals: np.ndarray) -> tuple:
+        rle_values, rle_counts = rle_encode(residuals)
+        encoded_bits, codebook = huffman_encode_rle(rle_values, rle_counts)
+        return len(rle_values), pack_huffman_table(*codebook), encoded_bits.tobytes()
+    
+    @staticmethod
+    def decode(table: bytes, payload: bytes, num_symbols: int, length: int) -> np.ndarray:
+        rle_values, rle_counts = huffman_decode_rle(_to_bits(payload), unpack_huffman_table(table), num_symbols)
+        return rle_decode(rle_values, rle_counts, length)
+    
+    @staticmethod
+    def table_symbols(table: bytes) -> int:
+        return struct.unpack_from('!I', table)[0]
+
+
+class SplitHuffmanCoder(EntropyCoder):
+    """RLE puis Huffman avec tables séparées pour valeurs et longueurs"""
+    
+    name = 'huffman-split'
+    coder_id = 1
+    
+    @staticmethod
+    def encode(residuals: np.ndarray) -> tuple:
+        rle_values, rle_counts = rle_encode(residuals)
+        encoded_bits, tables = split_encode_rle(rle_values, rle_counts)
+        return len(rle_values), tables, encoded_bits.tobytes()
+    
+    @staticmethod
+    def decode(table: bytes, payload: bytes, num_symbols: int, length: int) -> np.ndarray:
+        rle_values, rle_counts = split_decode_rle(_to_bits(payload), table, num_symbols)
+        return rle_decode(rle_values, rle_counts, length)
+    
+    @staticmethod
+    def table_symbols(table: bytes) -> int:
+        # Table des valeurs puis table des longueurs de séquence
+        value_table_size = struct.unpack_from('!I', table, 10)[0]
+        return (struct.unpack_from('!I', table, 14)[0]
+                + struct.unpack_from('!I', table, 14 + value_table_size)[0])
+
+
+class RansCoder(EntropyCoder):
+    """RLE puis rANS entrelacé sur les paires (valeur, nombre)"""
+    
+    name = 'rans'
+    coder_id = 2
+    
+    @staticmethod
+    def encode(residuals: np.ndarray) -> tuple:
+        rle_values, rle_counts = rle_encode(residuals)
+        table, payload = rans_encode(pack_rle_symbols(rle_values, rle_counts))
+        return len(rle_values), table, payload
+    
+    @staticmethod
+    def decode(table: bytes, payload: bytes, num_symbols: int, length: int) -> np.ndarray:
+        rle_values, rle_counts = unpack_rle_symbols(rans_decode(table, payload, num_symbols))
+        return rle_decode(rle_values, rle_counts, length)
+    
+    @staticmethod
+    def table_symbols(table: bytes) -> int:
+        return struct.unpack_from('!BI', table)[1]
+
+
+class RiceCoder(EntropyCoder):
+    """Golomb-Rice adaptatif par bloc directement sur les résidus (mode rapide)"""
+    
+    name = 'rice'
+    coder_id = 3
+    
+    @staticmethod
+    def encode(residuals: np.ndarray) -> tuple:
+        params, payload = rice_encode(residuals)
+        return len(residuals), params, payload
+    
+    @staticmethod
+    def decode(table: bytes, payload: bytes, num_symbols: int, length: int) -> np.ndarray:
+        return rice_decode(table, payload, length)
+    
+    @staticmethod
+    def table_symbols(table: bytes) -> int:
+        # Paramètres k par bloc seulement: pas d'alphabet
+        return 0
+
+
+ENTROPY_CODERS = {coder.name: coder for coder in (HuffmanCoder, SplitHuffmanCoder, RansCoder, RiceCoder)}
+
+
+def encode_residuals(coder: type, residuals: np.ndarray) -> tuple:
+    """
+    Encode des résidus avec `coder`, ou avec Huffman si l'alphabet de la
+    trame dépasse ce que rANS accepte (2^(MAX_PROB_BITS - 2) symboles).
+    
+    Args:
+        coder: Codeur entropique demandé
+        residuals: Résidus Delta (int16)
+        
+    Returns:
+        tuple: (codeur utilisé, nombre_symboles, table, flux)
+    """
+    try:
+        return (coder, *coder.encode(residuals))
+    except AlphabetTooLarge:
+        return (HuffmanCoder, *HuffmanCoder.encode(residuals))
+
+
+def get_coder(name: str) -> type:
+    """
+    Retourne le codeur entropique enregistré sous `name`.
+    
+    Raises:
+        ValueError: Si aucun codeur ne porte ce nom
+    """
+    if name not in ENTROPY_CODERS:
+        raise ValueError(f"Codeur entropique inconnu: {name}")
+    return ENTROPY_CODERS[name]
+
+
+def get_coder_by_id(coder_id: int) -> type:
+    """
+    Retourne le codeur entropique correspondant à l'identifiant stocké.
+    
+    Raises:
+        ValueError: Si l'identifiant est inconnu
+    """
+    for coder in ENTROPY_CODERS.values():
+        if coder.coder_id == coder_id:
+            return coder
+    raise ValueError(f"Identifiant de codeur entropique inconnu: {coder_id}")
+
+
+def _to_bits(payload) -> bitarray:
+    """Vue bitarray (sans copie, en lecture seule) d'un flux d'octets ou d'une memoryview"""
+    return bitarray(buffer=payload, endian='big')
@@ -25,6 +25,9 @@ def normalisation(centered_sound_arr):
     """
     Normalise le signal entre -1 et 1.
     
+    Un signal constant (silence) garde une échelle de 1 pour éviter la
+    division par zéro.
+    
     Args:
         centered_sound_arr: Signal centré
         
@@ -32,6 +35,8 @@ def normalisation(centered_sound_arr):
         tuple: (signal_normalisé, valeur_max)
     """
     saved_max = np.max(np.abs(centered_sound_arr))
+    if saved_max == 0:
+        saved_max = 1.0
     signal_normalized = centered_sound_arr / saved_max
     return signal_normalized, saved_max
 
@@ -24,7 +24,9 @@ def channelsDistance(left, right):
     # Ratio d'énergie dans la différence
     mono = (left + right) / 2
     diff_signal = left - right
-    energy_ratio = np.sum(diff_signal**2) / np.sum(mono**2)
+    diff_energy = np.sum(diff_signal**2)
+    # Canaux identiques (dont deux canaux silencieux, 0/0): mode mono
+    energy_ratio = diff_energy / np.sum(mono**2) if diff_energy else 0.0
 
     metrics = {
         'mean_absolute_diff': mae,
@@ -1,6 +1,14 @@
 """Module de logique métier"""
 
-from .compressor import AudioCompressor
-from .audio_processor import AudioProcessor
+__all__ = ['AudioCompressor', 'AudioProcessor']
 
-__all__ = ['AudioCompressor', 'AudioProcessor']
\ No newline at end of file
+
+def __getattr__(name):
+    # Import différé: `core.container` seul (en-têtes .IRM) ne charge ni pydub ni le compresseur
+    if name == 'AudioCompressor':
+        from .compressor import AudioCompressor
+        return AudioCompressor
+    if name == 'AudioProcessor':
+        from .audio_processor import AudioProcessor
+        return AudioProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -7,6 +7,8 @@ import os
 from pathlib import Path
 from pydub import AudioSegment
 
+from core.source import cached_source, read_source_info
+
 
 class AudioProcessor:
     """Classe pour le traitement des fichiers audio"""
@@ -33,6 +35,9 @@ class AudioProcessor:
         """
         Récupère les informations d'un fichier audio
         
+        Le fichier n'est pas décodé: le format vient de l'audio déjà décodé
+        s'il est en cache (voir load_source), sinon des en-têtes du fichier.
+        
         Args:
             file_path: Chemin du fichier
             
@@ -42,16 +47,28 @@ class AudioProcessor:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Fichier introuvable: {file_path}")
         
-        sound = AudioSegment.from_file(file_path)
+        sound = cached_source(file_path)
+        if sound is not None:
+            info = {
+                'duration': len(sound) / 1000.0,  # en secondes
+                'channels': sound.channels,
+                'sample_rate': sound.frame_rate,
+                'sample_width': sound.sample_width
+            }
+        else:
+            header = read_source_info(file_path)
+            info = {
+                'duration': header['duration'] or 0.0,
+                'channels': header['channels'],
+                'sample_rate': header['framerate'],
+                'sample_width': header['sample_width']
+            }
         
         return {
             'path': file_path,
             'name': Path(file_path).name,
             'size': os.path.getsize(file_path),
-            'duration': len(sound) / 1000.0,  # en secondes
-            'channels': sound.channels,
-            'sample_rate': sound.frame_rate,
-            'sample_width': sound.sample_width
+            **info
         }
     
     @staticmethod
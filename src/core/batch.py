@@ -0,0 +1,237 @@
+"""
+Module de compression par lots
+Compresse une arborescence de fichiers audio dans un pool de processus,
+avec un manifeste qui permet de reprendre un traitement interrompu
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from compression.utils import taux_reduction
+from core.compressor import AudioCompressor
+from core.parallel import resolve_workers, unordered_map
+
+
+logger = logging.getLogger(__name__)
+
+# Extensions des fichiers audio traités (formats lus par pydub/ffmpeg)
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.ogg', '.flac')
+
+# Nom du manifeste par défaut, dans le dossier de sortie
+MANIFEST_NAME = 'manifest.jsonl'
+
+# Taille des blocs lus pour le hachage des fichiers source
+HASH_CHUNK = 1 << 20
+
+
+def find_audio_files(input_dir: str, extensions=AUDIO_EXTENSIONS) -> list:
+    """
+    Liste les fichiers audio d'une arborescence, dans un ordre stable.
+    
+    Args:
+        input_dir: Dossier racine
+        extensions: Extensions acceptées (insensibles à la casse)
+        
+    Returns:
+        list: Chemins relatifs à `input_dir` (Path), triés
+    """
+    root = Path(input_dir)
+    files = []
+    for folder, _, names in os.walk(root):
+        for name in names:
+            if name.lower().endswith(extensions):
+                files.append((Path(folder) / name).relative_to(root))
+    return sorted(files)
+
+
+def load_manifest(manifest_path: str) -> dict:
+    """
+    Lit un manifeste JSON Lines (une ligne par fichier traité).
+    
+    Pour un même fichier, la dernière ligne l'emporte. Une dernière ligne
+    tronquée (arrêt pendant l'écriture) est ignorée.
+    
+    Args:
+        manifest_path: Chemin du manifeste
+        
+    Returns:
+        dict: Entrées du manifeste par chemin relatif du fichier source
+    """
+    entries = {}
+    if not os.path.exists(manifest_path):
+        return entries
+    with open(manifest_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry['input']] = entry
+    return entries
+
+
+def output_name(relative: Path) -> Path:
+    """
+    Chemin relatif du fichier .IRM d'un fichier source.
+    
+    L'extension source est conservée (song.wav -> song.wav.IRM): song.wav
+    et song.flac d'un même dossier ne s'écrasent pas l'un l'autre.
+    """
+    return relative.with_name(relative.name + '.IRM')
+
+
+def is_done(entry: dict, source: Path, output: Path, coder: str, frame_ms: int) -> bool:
+    """
+    Indique si un fichier a déjà été compressé avec succès.
+    
+    Le fichier source doit avoir la même taille et la même date de
+    modification qu'au moment de la compression, et le fichier .IRM la
+    taille enregistrée: aucun fichier n'est relu pour le vérifier. Le codeur
+    et la durée de trame doivent être ceux demandés (une entrée qui ne les
+    enregistre pas est refaite).
+    """
+    if entry is None or entry.get('error'):
+        return False
+    if entry.get('coder') != coder or entry.get('frame_ms') != frame_ms:
+        return False
+    try:
+        stat = source.stat()
+        return (stat.st_size == entry['input_size'] and stat.st_mtime_ns == entry['mtime_ns']
+                and output.stat().st_size == entry['output_size'])
+    except OSError:
+        return False
+
+
+def file_hash(path: Path) -> str:
+    """Empreinte SHA-256 d'un fichier, lu par blocs"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compress_job(job: tuple) -> dict:
+    """
+    Compresse un fichier (exécuté dans un processus du pool).
+    
+    Le fichier .IRM est écrit sous un nom temporaire puis renommé: un arrêt
+    en cours de compression ne laisse pas de fichier incomplet à sa place.
+    Les erreurs sont enregistrées dans l'entrée au lieu d'être levées.
+    
+    Args:
+        job: (chemin relatif, chemin source, chemin .IRM, codeur, durée de trame)
+        
+    Returns:
+        dict: Entrée du manifeste
+    """
+    relative, source, output, coder, frame_ms = job
+    stat = source.stat()
+    entry = {
+        'input': relative,
+        'input_size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'output': str(output),
+        'coder': coder,
+        'frame_ms': frame_ms,
+        'sha256': None,
+        'output_size': None,
+        'ratio': None,
+        'hash_seconds': None,
+        'compress_seconds': None,
+        'error': None,
+    }
+    
+    partial_output = output.with_name(output.name + '.part')
+    start = time.perf_counter()
+    try:
+        entry['sha256'] = file_hash(source)
+        entry['hash_seconds'] = time.perf_counter() - start
+        
+        output.parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        AudioCompressor.compress(str(source), str(partial_output), coder=coder, frame_ms=frame_ms)
+        os.replace(partial_output, output)
+        entry['compress_seconds'] = time.perf_counter() - start
+        
+        entry['output_size'] = output.stat().st_size
+        entry['ratio'] = float(taux_reduction(source, output))
+    except Exception as error:
+        entry['error'] = f"{type(error).__name__}: {error}"
+        if partial_output.exists():
+            partial_output.unlink()
+    return entry
+
+
+def run_batch(input_dir: str, output_dir: str, manifest_path: str = None,
+              coder: str = 'huffman', frame_ms: int = AudioCompressor.FRAME_MS,
+              workers: int = None) -> dict:
+    """
+    Compresse tous les fichiers audio d'une arborescence.
+    
+    Chaque fichier est compressé vers `output_dir` en conservant
+    l'arborescence (voir output_name). Les fichiers sont répartis
+    sur un pool de processus, un fichier par tâche. Chaque résultat est
+    ajouté au manifeste dès que son fichier est terminé, dans l'ordre de fin;
+    au lancement suivant, les fichiers déjà compressés avec le même codeur et
+    la même durée de trame (voir is_done) sont sautés, les échecs réessayés.
+    
+    Args:
+        input_dir: Dossier des fichiers source
+        output_dir: Dossier des fichiers .IRM
+        manifest_path: Manifeste JSON Lines (défaut: output_dir/manifest.jsonl)
+        coder: Codeur entropique
+        frame_ms: Durée d'une trame en millisecondes
+        workers: Nombre de processus (None ou 0: tous les coeurs)
+        
+    Returns:
+        dict: Bilan (fichiers traités, sautés, en erreur, octets, débit en Mo/s)
+    """
+    input_root = Path(input_dir)
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifest_path or output_root / MANIFEST_NAME
+    workers = resolve_workers(workers)
+    
+    manifest = load_manifest(manifest_path)
+    files = find_audio_files(input_root)
+    jobs = []
+    skipped = 0
+    for relative in files:
+        source = input_root / relative
+        output = output_root / output_name(relative)
+        if is_done(manifest.get(relative.as_posix()), source, output, coder, frame_ms):
+            skipped += 1
+        else:
+            jobs.append((relative.as_posix(), source, output, coder, frame_ms))
+            
+    logger.info("%d fichiers: %d à compresser, %d déjà faits (%d processus)",
+                len(files), len(jobs), skipped, workers)
+          
+    summary = {'files': len(files), 'compressed': 0, 'skipped': skipped, 'failed': 0,
+               'input_bytes': 0, 'output_bytes': 0}
+    start = time.perf_counter()
+    with open(manifest_path, 'a', encoding='utf-8') as manifest_file:
+        # Résultats dans l'ordre de fin: un fichier long n'empêche ni les autres
+        # processus d'avancer ni l'écriture des entrées déjà terminées
+        for entry in unordered_map(compress_job, jobs, workers=workers):
+            manifest_file.write(json.dumps(entry) + '\n')
+            manifest_file.flush()
+            if entry['error']:
+                summary['failed'] += 1
+                logger.error("%s: %s", entry['input'], entry['error'])
+            else:
+                summary['compressed'] += 1
+                summary['input_bytes'] += entry['input_size']
+                summary['output_bytes'] += entry['output_size']
+                logger.info("%s: %s%%", entry['input'], entry['ratio'])
+                
+    summary['seconds'] = time.perf_counter() - start
+    summary['mb_per_s'] = summary['input_bytes'] / 1e6 / summary['seconds'] if summary['seconds'] else 0.0
+    logger.info("%d compressés, %d en erreur, %.2f Mo/s",
+                summary['compressed'], summary['failed'], summary['mb_per_s'])
+    return summary
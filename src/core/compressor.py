@@ -3,44 +3,95 @@ Module de compression/décompression audio
 Gère la logique de compression complète
 """
 
+import logging
+import os
 import struct
-import zlib
-import pickle
-from bitarray import bitarray
+from functools import partial
 from pydub import AudioSegment
 import numpy as np
 
-from compression.stereotreatment import process_stereo_sound, Back_to_real_stereo
-from compression.quantification import (
-    compute_mean, normalisation, quantification,
-    dequantification, denormalisation, decompute_mean
-)
-from compression.encoding import (
-    delta_encode, delta_decode, rle_encode, 
-    rle_decode, huffman_encode_rle, huffman_decode_rle
+from compression.stereotreatment import process_stereo_sound, Back_to_real_stereo, channelsDistance
+from compression.entropy import get_coder
+from core.container import (
+    map_file, is_framed, write_frames, read_layout, verify,
+    encode_frame, profile_encode_frame, decode_frame_bytes, profile_decode_frame,
+    read_frames, decode_v1
 )
+from core.parallel import ordered_map, resolve_workers
+from core.pcm_stream import open_pcm_stream, write_wav_stream
+from core.profiling import NO_PROFILE, Profile, get_profile
+from core.progress import NO_PROGRESS, Progress, OperationCancelled, get_progress
+from core.source import load_source
+
+
+logger = logging.getLogger(__name__)
 
 
 class AudioCompressor:
     """Classe principale pour la compression audio"""
     
+    # Durée d'une trame du conteneur .IRM
+    FRAME_MS = 4000
+    
+    # Mémoire de travail visée par compress_stream (octets)
+    MAX_MEMORY = 64 * 1024 * 1024
+    
+    # Mémoire de travail d'encode_frame par échantillon (mesurée: ~110 octets)
+    ENCODE_BYTES_PER_SAMPLE = 128
+    
+    # Plus petite trame acceptée par compress_stream
+    MIN_FRAME_SAMPLES = 4096
+    
+    # Avancement global (progress) à la fin du chargement et du traitement stéréo
+    LOAD_PROGRESS = 0.10
+    STEREO_PROGRESS = 0.15
+    
     @staticmethod
-    def compress(input_path: str, output_path: str) -> dict:
+    def compress(input_path: str, output_path: str, coder: str = 'huffman',
+                 frame_ms: int = FRAME_MS, workers: int = 1, profile: bool = True,
+                 progress=None, cancel=None, reconstruct: bool = False) -> dict:
         """
         Compresse un fichier audio
         
+        Le signal est découpé en trames de `frame_ms` millisecondes, encodées
+        indépendamment (conteneur .IRM version 3: index des trames et CRC32).
+        Avec `workers` > 1, les trames sont encodées dans un pool de processus
+        puis écrites dans l'ordre: le fichier produit est identique quel que
+        soit le nombre de processus.
+        
         Args:
             input_path: Chemin du fichier source
             output_path: Chemin du fichier compressé
+            coder: Codeur entropique ('huffman', 'huffman-split', 'rans' ou 'rice')
+            frame_ms: Durée d'une trame en millisecondes
+            workers: Nombre de processus (None ou 0: tous les coeurs)
+            profile: Mesure la durée et les compteurs de chaque étage
+                     ('seconds' et 'stages' dans les statistiques, voir Profile)
+            progress: Callback progress(étage, fraction) de l'avancement global
+                      ('load', 'stereo' puis 'encode' trame par trame, voir Progress)
+            cancel: Annulation (threading.Event), vérifiée entre deux étages ou trames
+            reconstruct: Ajoute aux statistiques l'audio reconstruit ('audio',
+                         identique à decompress(output_path)), calculé pendant
+                         l'encodage sans relire ni décoder le fichier
             
         Returns:
             dict: Statistiques de compression
+            
+        Raises:
+            OperationCancelled: Si `cancel` est activé (le fichier compressé est supprimé)
         """
-        print(f"📁 Chargement: {input_path}")
+        get_coder(coder)
+        profiler = get_profile(profile)
+        reporter = get_progress(progress, cancel)
+        
+        logger.info("Chargement: %s", input_path)
         
         # 1. Chargement de l'audio
-        sound = AudioSegment.from_file(input_path)
+        reporter.update('load', 0.0)
+        start = profiler.start()
+        sound = load_source(input_path, keep=False)
         sound_array = np.array(sound.get_array_of_samples())
+        profiler.add('load', start, bytes_out=sound_array.nbytes)
         
         metadata = {
             'bits': sound_array.dtype.itemsize * 8,
@@ -50,126 +101,653 @@ class AudioCompressor:
             'original_samples': len(sound_array)
         }
         
-        print(f"📊 Format: {metadata['channels']} canaux, {metadata['framerate']} Hz")
+        logger.info("Format: %d canaux, %d Hz", metadata['channels'], metadata['framerate'])
 
         # 2. Traitement stéréo
+        reporter.update('stereo', AudioCompressor.LOAD_PROGRESS)
+        start = profiler.start()
         if sound.channels == 2:
             result = process_stereo_sound(sound_array)
-            print(f"🎧 Mode stéréo: {result[0]['mode']}")
+            stereo_mode = result[0]['mode']
+            logger.info("Mode stéréo: %s", stereo_mode)
             sound_processed = result[1]
         else:
-            print("🎧 Mode mono")
+            logger.info("Mode mono")
+            stereo_mode = 'm'
             sound_processed = sound_array
+        profiler.add('stereo', start, bytes_in=sound_array.nbytes, bytes_out=sound_processed.nbytes)
 
         # 3. Sous-échantillonnage
+        start = profiler.start()
         lowered_samples = sound_processed[0::2]
-        print(f"📉 Échantillons: {len(sound_array)} → {len(lowered_samples)}")
-        
-        # 4-5. Prétraitement
-        centered, mean = compute_mean(lowered_samples)
-        normalized, max_val = normalisation(centered)
-        quantized = quantification(normalized)
-        
-        # 6-8. Compression
-        residuals = delta_encode(quantized)
-        rle_data = rle_encode(residuals)
-        encoded_bits, huffman_codes = huffman_encode_rle(rle_data)
-        
-        print(f"🗜️  RLE: {len(residuals)} → {len(rle_data)} paires")
-        print(f"🗜️  Huffman: {len(encoded_bits)} bits")
-        
-        # Création du header
-        header = struct.pack('!IIIffIIII',
-                           sound.frame_rate,
-                           len(lowered_samples),
-                           len(rle_data),
-                           max_val,
-                           mean,
-                           metadata['bits'],
-                           metadata['channels'],
-                           metadata['framerate'],
-                           metadata['frame_width'])
-        
-        huffman_bytes = zlib.compress(pickle.dumps(huffman_codes))
-        
-        # Écriture du fichier
-        with open(output_path, 'wb') as f:
-            f.write(header)
-            f.write(struct.pack('!I', len(huffman_bytes)))
-            f.write(huffman_bytes)
-            f.write(encoded_bits.tobytes())
+        profiler.add('downsample', start, bytes_in=sound_processed.nbytes, bytes_out=lowered_samples.nbytes)
+        logger.info("Échantillons: %d → %d", len(sound_array), len(lowered_samples))
         
+        # 4-8. Compression par trames indépendantes
+        frame_samples = max(1, frame_ms * sound.frame_rate // 2000)
+        params = dict(metadata,
+                      total_samples=len(lowered_samples),
+                      frame_samples=frame_samples,
+                      stereo_mode=stereo_mode)
+        
+        frames = (lowered_samples[start:start + frame_samples]
+                  for start in range(0, len(lowered_samples), frame_samples))
+        
+        signals = [] if reconstruct else None
+        frame_count, compressed_bytes = AudioCompressor._write_container(
+            output_path, params, frames, coder, workers, profiler,
+            reporter, -(-len(lowered_samples) // frame_samples), AudioCompressor.STEREO_PROGRESS,
+            signals)
+            
+        logger.info("%s: %d trames, %d octets (%d processus)",
+                    coder, frame_count, compressed_bytes, resolve_workers(workers))
+              
         stats = {
             'original_samples': metadata['original_samples'],
             'compressed_samples': len(lowered_samples),
-            'rle_pairs': len(rle_data),
-            'compressed_bits': len(encoded_bits),
-            'compressed_bytes': len(encoded_bits.tobytes())
+            'coder': coder,
+            'frames': frame_count,
+            'compressed_bytes': compressed_bytes
         }
+        if reconstruct:
+            blocks = AudioCompressor.pcm_blocks(signals, params, profile=profiler)
+            stats['audio'] = AudioCompressor._to_segment([block for _, block in blocks], params)
+        if profiler.enabled:
+            stats.update(profiler.result())
+            profiler.log('compress', input_path)
         
-        print(f"✅ Compression terminée")
+        logger.info("Compression terminée")
         return stats
     
     @staticmethod
-    def decompress(input_path: str) -> AudioSegment:
+    def compress_stream(input_path: str, output_path: str, coder: str = 'huffman',
+                        frame_ms: int = FRAME_MS, workers: int = 1,
+                        max_memory: int = MAX_MEMORY, profile: bool = True,
+                        progress=None, cancel=None) -> dict:
         """
-        Décompresse un fichier .IRM
+        Compresse un fichier audio par blocs, à mémoire bornée
+        
+        Le fichier est lu bloc par bloc (WAV directement, autres formats via
+        le pipe d'ffmpeg) et chaque bloc est encodé dès sa lecture: la mémoire
+        utilisée ne dépend pas de la durée du fichier. Les trames sont
+        raccourcies si nécessaire pour tenir dans `max_memory`.
+        
+        Le mode stéréo est choisi sur le premier bloc non silencieux puis
+        appliqué à tout le fichier (compress le choisit sur le fichier
+        entier): les blocs de silence qui le précèdent sont gardés en attente
+        (leur taille seulement) et encodés une fois le mode connu.
         
         Args:
-            input_path: Chemin du fichier compressé
+            input_path: Chemin du fichier source
+            output_path: Chemin du fichier compressé
+            coder: Codeur entropique ('huffman', 'huffman-split', 'rans' ou 'rice')
+            frame_ms: Durée maximale d'une trame en millisecondes
+            workers: Nombre de processus (None ou 0: tous les coeurs)
+            max_memory: Mémoire de travail visée pour l'encodage (octets)
+            profile: Mesure la durée et les compteurs de chaque étage
+            progress: Callback progress('encode', fraction) par bloc lu (fichiers WAV;
+                      fin seulement pour les autres formats, de durée inconnue)
+            cancel: Annulation (threading.Event), vérifiée entre deux blocs
             
         Returns:
-            AudioSegment: Audio décompressé
+            dict: Statistiques de compression
+            
+        Raises:
+            ValueError: Si `max_memory` est trop faible pour une trame minimale
+            OperationCancelled: Si `cancel` est activé (le fichier compressé est supprimé)
         """
-        print(f"📁 Décompression: {input_path}")
+        get_coder(coder)
+        profiler = get_profile(profile)
+        reporter = get_progress(progress, cancel)
         
-        # Lecture du fichier
-        with open(input_path, 'rb') as f:
-            header = f.read(36)
-            sample_rate, length, num_pairs, max_val, mean, bits, channels, framerate, frame_width = \
-                struct.unpack('!IIIffIIII', header)
+        # Trames bornées par la mémoire: chaque processus encode une trame,
+        # le processus principal prépare la suivante
+        budget_samples = max_memory // (AudioCompressor.ENCODE_BYTES_PER_SAMPLE
+                                         * (resolve_workers(workers) + 1))
+        if budget_samples < AudioCompressor.MIN_FRAME_SAMPLES:
+            raise ValueError(f"max_memory trop faible: {max_memory} octets")
             
-            print(f"📊 Format: {channels} canaux, {framerate} Hz")
+        logger.info("Lecture par blocs: %s", input_path)
+        
+        # 1. Ouverture du flux PCM
+        metadata, iter_blocks = open_pcm_stream(input_path)
+        channels = metadata['channels']
+        frame_samples = max(1, min(frame_ms * metadata['framerate'] // 2000, budget_samples))
+        
+        logger.info("Format: %d canaux, %d Hz", channels, metadata['framerate'])
+        
+        # Compteurs et mode stéréo complétés pendant la lecture, l'en-tête
+        # est réécrit à la fin
+        params = {
+            'bits': metadata['sample_width'] * 8,
+            'channels': channels,
+            'framerate': metadata['framerate'],
+            'frame_width': metadata['frame_width'],
+            'original_samples': 0,
+            'total_samples': 0,
+            'frame_samples': frame_samples,
+            'stereo_mode': None,
+        }
+        
+        def lower(block):
+            # 3. Sous-échantillonnage
+            start = profiler.start()
+            lowered = AudioCompressor.lower_block(block, channels, params['stereo_mode'])
+            profiler.add('downsample', start, bytes_in=block.nbytes, bytes_out=lowered.nbytes)
+            params['total_samples'] += len(lowered)
+            for start in range(0, len(lowered), frame_samples):
+                yield lowered[start:start + frame_samples]
+                
+        def frames():
+            # Un bloc de 2 × frame_samples trames audio donne une trame
+            # sous-échantillonnée complète (deux en mode stéréo 's')
+            blocks = iter_blocks(2 * frame_samples)
+            # (taille, type) des blocs silencieux lus avant le choix du mode
+            silent = []
+            while True:
+                start = profiler.start()
+                block = next(blocks, None)
+                if block is None:
+                    break
+                profiler.add('load', start, bytes_out=block.nbytes)
+                params['original_samples'] += len(block)
+                reporter.update('encode', params['original_samples'] / channels / metadata['frames']
+                                if metadata['frames'] else 0.0)
+                
+                # 2. Traitement stéréo (décidé sur le premier bloc non silencieux:
+                # le silence ne dit rien de l'écart entre les canaux)
+                if params['stereo_mode'] is None:
+                    if channels == 2 and not block.any():
+                        silent.append((len(block), block.dtype))
+                        continue
+                    start = profiler.start()
+                    params['stereo_mode'] = AudioCompressor.choose_stereo_mode(block, channels)
+                    profiler.add('stereo', start, bytes_in=block.nbytes)
+                    for size, dtype in silent:
+                        yield from lower(np.zeros(size, dtype=dtype))
+                        
+                yield from lower(block)
+                
+            # Fichier entièrement silencieux (ou vide)
+            if params['stereo_mode'] is None:
+                params['stereo_mode'] = 'm'
+                for size, dtype in silent:
+                    yield from lower(np.zeros(size, dtype=dtype))
+                    
+        # 4-8. Compression par trames indépendantes
+        reporter.update('encode', 0.0)
+        frame_count, compressed_bytes = AudioCompressor._write_container(
+            output_path, params, frames(), coder, workers, profiler)
+        reporter.update('encode', 1.0)
             
-            huffman_size = struct.unpack('!I', f.read(4))[0]
-            huffman_codes = pickle.loads(zlib.decompress(f.read(huffman_size)))
+        logger.info("Échantillons: %d → %d", params['original_samples'], params['total_samples'])
+        logger.info("%s: %d trames, %d octets (%d processus)",
+                    coder, frame_count, compressed_bytes, resolve_workers(workers))
+              
+        stats = {
+            'original_samples': params['original_samples'],
+            'compressed_samples': params['total_samples'],
+            'coder': coder,
+            'frames': frame_count,
+            'compressed_bytes': compressed_bytes
+        }
+        if profiler.enabled:
+            stats.update(profiler.result())
+            profiler.log('compress', input_path)
+        
+        logger.info("Compression terminée")
+        return stats
+    
+    @staticmethod
+    def choose_stereo_mode(block: np.ndarray, channels: int) -> str:
+        """
+        Choisit le mode stéréo comme process_stereo_sound ('m' pour un fichier mono)
+        
+        Args:
+            block: Échantillons entrelacés
+            channels: Nombre de canaux
             
-            encoded_bits = bitarray()
-            encoded_bits.frombytes(f.read())
+        Returns:
+            str: 'm' ou 's'
+        """
+        if channels != 2:
+            logger.info("Mode mono")
+            return 'm'
+        metrics = channelsDistance(block[0::2], block[1::2])
+        stereo_mode = 'm' if metrics['recommend_mono'] else 's'
+        logger.info("Mode stéréo: %s", stereo_mode)
+        return stereo_mode
+    
+    @staticmethod
+    def lower_block(block: np.ndarray, channels: int, stereo_mode: str) -> np.ndarray:
+        """
+        Traitement stéréo et sous-échantillonnage d'un bloc
+        
+        Équivaut à process_stereo_sound(block)[1][0::2] avec le mode imposé:
+        canal gauche une trame sur deux en mode 'm', canal gauche entier en
+        mode 's' (les différences gauche-droite sont aux indices impairs).
+        
+        Args:
+            block: Échantillons entrelacés (nombre pair de trames audio, sauf le dernier bloc)
+            channels: Nombre de canaux
+            stereo_mode: 'm' ou 's'
             
-            # Décodage
-            rle_data = huffman_decode_rle(encoded_bits, huffman_codes, num_pairs)
-            residuals = rle_decode(rle_data, length)
-            pcm_data = delta_decode(residuals)
+        Returns:
+            np.ndarray: Échantillons sous-échantillonnés
+        """
+        if channels == 2 and stereo_mode == 'm':
+            return block[0::4]
+        return block[0::2]
+    
+    @staticmethod
+    def _write_container(output_path: str, params: dict, frames, coder: str, workers: int,
+                         profile: Profile = NO_PROFILE, progress: Progress = NO_PROGRESS,
+                         total_frames: int = None, progress_start: float = 0.0,
+                         signals: list = None) -> tuple:
+        """
+        Encode les trames et écrit le conteneur .IRM (version 3)
         
-        # Reconstruction du signal
-        dequantized = dequantification(pcm_data, 256)
-        denormalized = denormalisation(dequantized, max_val)
-        decompressed = decompute_mean(denormalized, mean)
-
-        # Interpolation
-        demi_data = np.array(decompressed, dtype=float)
-        moyennes = (demi_data[:-1] + demi_data[1:]) / 2
-        resultat = np.empty(len(demi_data) + len(moyennes), dtype=np.dtype(f'int{bits}'))
-        resultat[0::2] = demi_data
-        resultat[1::2] = moyennes.astype(np.int16)
-
-        if len(demi_data) % 2 == 0:
-            resultat = np.append(resultat, demi_data[-1])
-        resultat = resultat.astype(np.dtype(f'int{bits}'))
-
-        # Reconstruction stéréo
-        if channels == 2:
-            imitated_stereo = Back_to_real_stereo(resultat, 'm')
+        L'en-tête est écrit après les trames: `params` peut être complété
+        pendant l'itération de `frames` (lecture par blocs).
+        
+        Args:
+            output_path: Chemin du fichier compressé
+            params: Paramètres du flux (voir pack_header)
+            frames: Échantillons de chaque trame (itérable)
+            coder: Nom du codeur entropique
+            workers: Nombre de processus
+            profile: Profil de mesure (les profils des processus y sont fusionnés)
+            progress: Suivi de l'avancement, de `progress_start` à 1 trame par trame encodée
+            total_frames: Nombre de trames attendues
+            progress_start: Avancement global avant la première trame
+            signals: Liste complétée par le signal reconstruit de chaque trame
+                     (None: pas de reconstruction, voir encode_frame)
+            
+        Returns:
+            tuple: (nombre de trames, taille du fichier en octets)
+        """
+        reconstruct = signals is not None
+        if not profile.enabled:
+            encoded = ordered_map(partial(encode_frame, coder=coder, reconstruct=reconstruct),
+                                  frames, workers)
+        elif resolve_workers(workers) == 1:
+            encoded = ordered_map(partial(encode_frame, coder=coder, profile=profile,
+                                          reconstruct=reconstruct), frames, workers)
         else:
-            imitated_stereo = resultat
-
-        audio = AudioSegment(
+            encoded = profile.merged(ordered_map(partial(profile_encode_frame, coder=coder,
+                                                         reconstruct=reconstruct), frames, workers))
+        if reconstruct:
+            encoded = AudioCompressor._keep_signals(encoded, signals)
+        encoded = progress.track(encoded, 'encode', total_frames, progress_start)
+        try:
+            with open(output_path, 'wb') as f:
+                return write_frames(f, params, encoded, profile)
+        except OperationCancelled:
+            os.remove(output_path)
+            raise
+    
+    @staticmethod
+    def _keep_signals(encoded, signals: list):
+        """Rend les trames sérialisées de (trame, signal) et ajoute les signaux à `signals`"""
+        for frame, signal in encoded:
+            signals.append(signal)
+            yield frame
+    
+    @staticmethod
+    def decompress(input_path: str, start_ms: int = None, end_ms: int = None,
+                   workers: int = 1, stats: dict = None, progress=None, cancel=None) -> AudioSegment:
+        """
+        Décompresse un fichier .IRM, en entier ou sur une plage de temps
+        
+        Avec `start_ms`/`end_ms`, seules les trames qui recouvrent la plage
+        sont lues et décodées (fichiers par trames): le temps de décodage
+        dépend de la durée de la plage, pas de celle du fichier. Les trames
+        d'un fichier par trames sont indépendantes: avec `workers` > 1 elles
+        sont décodées dans un pool de processus.
+        
+        Args:
+            input_path: Chemin du fichier compressé
+            start_ms: Début de la plage en millisecondes (défaut: début du fichier)
+            end_ms: Fin de la plage en millisecondes, exclue (défaut: fin du fichier)
+            workers: Nombre de processus (None ou 0: tous les coeurs)
+            stats: Dict complété par la durée et les compteurs de chaque étage
+                   (None: aucune mesure, voir decompress_stream)
+            progress: Callback progress('decode', fraction) trame par trame
+            cancel: Annulation (threading.Event), vérifiée entre deux trames
+            
+        Returns:
+            AudioSegment: Audio décompressé
+            
+        Raises:
+            OperationCancelled: Si `cancel` est activé
+        """
+        logger.info("Décompression: %s", input_path)
+        
+        # Lecture et décodage des trames
+        params, blocks = AudioCompressor.decompress_stream(input_path, start_ms, end_ms, workers,
+                                                           stats, progress, cancel)
+        
+        logger.info("Format: %d canaux, %d Hz", params['channels'], params['framerate'])
+        
+        audio = AudioCompressor._to_segment([block for _, block in blocks], params)
+        
+        logger.info("Décompression terminée")
+        return audio
+    
+    @staticmethod
+    def _to_segment(pcm: list, params: dict) -> AudioSegment:
+        """
+        Assemble les blocs PCM d'un flux en AudioSegment
+        
+        La taille d'échantillon vient de `bits`: `frame_width` (hérité de la
+        version d'origine) vaut 4 pour un flux stéréo 16 bits, ce qui rendait
+        une plage d'un nombre impair de trames impossible à assembler.
+        
+        Args:
+            pcm: Blocs PCM entrelacés (voir pcm_blocks)
+            params: Paramètres du flux (bits, channels, framerate)
+        
+        Returns:
+            AudioSegment: Audio reconstruit
+        """
+        imitated_stereo = np.concatenate(pcm) if pcm else np.zeros(0, dtype=np.dtype(f"int{params['bits']}"))
+        
+        return AudioSegment(
             data=imitated_stereo.tobytes(),
-            sample_width=frame_width,
-            frame_rate=framerate,
-            channels=channels
+            sample_width=params['bits'] // 8,
+            frame_rate=params['framerate'],
+            channels=params['channels']
         )
-
-        print("✅ Décompression terminée")
-        return audio
\ No newline at end of file
+    
+    @staticmethod
+    def decompress_stream(input_path: str, start_ms: int = None, end_ms: int = None,
+                          workers: int = 1, stats: dict = None, progress=None,
+                          cancel=None) -> tuple:
+        """
+        Décompresse un fichier .IRM bloc par bloc
+        
+        Seuls l'en-tête et l'index sont lus à l'appel; chaque trame est
+        ensuite lue, décodée et interpolée à la demande. Le temps avant le
+        premier bloc et la mémoire utilisée ne dépendent pas de la durée du
+        fichier (les fichiers version 1, sans trames, sont décodés en une fois).
+        Concaténés, les blocs donnent exactement le signal de `decompress`.
+        
+        Avec `stats`, chaque étage est mesuré; le dict reçoit 'seconds',
+        'stages' (voir Profile) et 'output_bytes' une fois le générateur
+        épuisé. Sans `stats`, aucune mesure n'est faite.
+        
+        Args:
+            input_path: Chemin du fichier compressé
+            start_ms: Début de la plage en millisecondes (défaut: début du fichier)
+            end_ms: Fin de la plage en millisecondes, exclue (défaut: fin du fichier)
+            workers: Nombre de processus (None ou 0: tous les coeurs)
+            stats: Dict complété par la durée et les compteurs de chaque étage
+            progress: Callback progress('decode', fraction) appelé au fil des trames décodées
+            cancel: Annulation (threading.Event): le générateur lève OperationCancelled
+                    entre deux blocs
+            
+        Returns:
+            tuple: (paramètres du flux, générateur de (position, bloc)) où
+                   position est l'indice de la première trame audio du bloc
+                   et bloc les échantillons PCM entrelacés (int16 pour 16 bits)
+        """
+        profile = get_profile(stats is not None)
+        reporter = get_progress(progress, cancel)
+        with map_file(input_path) as buffer:
+            if is_framed(buffer):
+                start = profile.start()
+                params, bounds, crcs = read_layout(buffer)
+                profile.add('read', start, bytes_in=int(bounds[0]))
+            else:
+                params, decompressed = decode_v1(buffer, profile)
+                bounds = None
+                
+        # Plage demandée, en trames audio de sortie (2n - 1 échantillons
+        # interpolés, plus une copie du dernier si n est pair)
+        total = params['total_samples']
+        output_frames = 2 * total - 1 + (total % 2 == 0) if total else 0
+        first = AudioCompressor._ms_to_frame(start_ms, params['framerate'], 0, output_frames)
+        end = AudioCompressor._ms_to_frame(end_ms, params['framerate'], output_frames, output_frames)
+        if end <= first:
+            blocks = iter(())
+            return params, blocks if stats is None else AudioCompressor._profile_blocks(blocks, stats, profile, input_path)
+            
+        if bounds is None:
+            signals, first_sample = iter([decompressed]), 0
+        else:
+            # Trames qui contiennent les échantillons sous-échantillonnés
+            # nécessaires: D[j // 2] et, pour j impair, D[j // 2 + 1]
+            frame_samples = params['frame_samples']
+            first_frame = first // 2 // frame_samples
+            last_frame = min(len(bounds) - 1, -(-((end - 1) // 2 + 2) // frame_samples))
+            signals = AudioCompressor._decode_frames(input_path, bounds, crcs, first_frame, last_frame,
+                                                     workers, profile)
+            first_sample = first_frame * frame_samples
+            
+        blocks = AudioCompressor.pcm_blocks(signals, params, first_sample, profile)
+        blocks = AudioCompressor._trim_blocks(blocks, first, end, params['channels'])
+        if reporter.enabled:
+            blocks = AudioCompressor._progress_blocks(blocks, reporter, first, end, params['channels'])
+        return params, blocks if stats is None else AudioCompressor._profile_blocks(blocks, stats, profile, input_path)
+    
+    @staticmethod
+    def decompress_to_wav(input_path: str, output_path: str, start_ms: int = None,
+                          end_ms: int = None, workers: int = 1, stats: dict = None,
+                          progress=None, cancel=None) -> int:
+        """
+        Décompresse un fichier .IRM vers un fichier WAV, bloc par bloc
+        
+        Le WAV est écrit au fur et à mesure du décodage, avec les mêmes
+        paramètres que decompress(input_path).export(output_path, format='wav').
+        
+        Args:
+            input_path: Chemin du fichier compressé
+            output_path: Chemin du fichier WAV
+            start_ms: Début de la plage en millisecondes (défaut: début du fichier)
+            end_ms: Fin de la plage en millisecondes, exclue (défaut: fin du fichier)
+            workers: Nombre de processus (None ou 0: tous les coeurs)
+            stats: Dict complété par la durée et les compteurs de chaque étage
+            progress: Callback progress('decode', fraction) trame par trame
+            cancel: Annulation (threading.Event), vérifiée entre deux trames
+            
+        Returns:
+            int: Nombre de trames audio écrites
+            
+        Raises:
+            OperationCancelled: Si `cancel` est activé (le fichier WAV est supprimé)
+        """
+        params, blocks = AudioCompressor.decompress_stream(input_path, start_ms, end_ms, workers,
+                                                           stats, progress, cancel)
+        try:
+            return write_wav_stream(output_path, (block for _, block in blocks),
+                                    params['channels'], params['bits'] // 8, params['framerate'])
+        except OperationCancelled:
+            os.remove(output_path)
+            raise
+    
+    @staticmethod
+    def verify(input_path: str) -> bool:
+        """
+        Vérifie l'intégrité d'un fichier .IRM sans le décoder
+        
+        Les sommes de contrôle (version 3) et la structure du fichier sont
+        vérifiées en une passe: un fichier corrompu ou tronqué est rejeté
+        sans décodage entropique.
+        
+        Args:
+            input_path: Chemin du fichier compressé
+            
+        Returns:
+            bool: True si le fichier est intègre
+        """
+        try:
+            with map_file(input_path) as buffer:
+                frames = verify(buffer)
+        except (ValueError, struct.error) as error:
+            logger.error("%s: %s", input_path, error)
+            return False
+        logger.info("%s: %d trames intègres", input_path, frames)
+        return True
+    
+    @staticmethod
+    def _ms_to_frame(ms: int, framerate: int, default: int, limit: int) -> int:
+        """Convertit une position en millisecondes en trame audio de sortie (bornée)"""
+        if ms is None:
+            return default
+        return int(np.clip(int(ms) * framerate // 1000, 0, limit))
+    
+    @staticmethod
+    def _decode_frames(input_path: str, bounds: np.ndarray, crcs: np.ndarray,
+                       first: int, last: int, workers: int, profile: Profile = NO_PROFILE):
+        """
+        Décode les trames `first` à `last` (exclue) d'un fichier par trames
+        
+        Le CRC32 de chaque trame est vérifié avant son décodage (version 3).
+        
+        Args:
+            input_path: Chemin du fichier compressé
+            bounds: Bornes des trames (voir read_layout)
+            crcs: CRC32 des trames
+            first: Première trame
+            last: Trame de fin (exclue)
+            workers: Nombre de processus
+            profile: Profil de mesure (les profils des processus y sont fusionnés)
+            
+        Yields:
+            np.ndarray: Signal reconstruit (float) de chaque trame
+        """
+        with map_file(input_path) as buffer:
+            frames = read_frames(buffer, bounds, first, last, crcs)
+            if resolve_workers(workers) == 1:
+                yield from ordered_map(partial(decode_frame_bytes, profile=profile), frames, workers)
+                return
+                
+            # Les vues sur le fichier ne passent pas d'un processus à l'autre
+            frames = map(bytes, frames)
+            if profile.enabled:
+                yield from profile.merged(ordered_map(profile_decode_frame, frames, workers))
+            else:
+                yield from ordered_map(decode_frame_bytes, frames, workers)
+    
+    @staticmethod
+    def pcm_blocks(signals, params: dict, first_sample: int = 0, profile: Profile = NO_PROFILE):
+        """
+        Interpolation et reconstruction stéréo, trame par trame
+        
+        Le dernier échantillon de chaque trame est conservé pour calculer la
+        moyenne qui le sépare du premier échantillon de la trame suivante:
+        le résultat est identique à une interpolation sur le signal entier.
+        
+        Args:
+            signals: Signaux sous-échantillonnés reconstruits (itérable)
+            params: Paramètres du flux (bits, channels, total_samples)
+            first_sample: Indice du premier échantillon sous-échantillonné de `signals`
+            profile: Profil de mesure (étage 'interpolate')
+            
+        Yields:
+            tuple: (position de la première trame audio, bloc PCM)
+        """
+        dtype = np.dtype(f"int{params['bits']}")
+        position = 2 * first_sample
+        sample = first_sample
+        previous = None
+        for signal in signals:
+            if len(signal) == 0:
+                continue
+            start = profile.start()
+            demi_data = np.array(signal, dtype=float)
+            if previous is not None:
+                demi_data = np.concatenate(([previous], demi_data))
+                
+            # Interpolation
+            moyennes = (demi_data[:-1] + demi_data[1:]) / 2
+            resultat = np.empty(len(demi_data) + len(moyennes), dtype=dtype)
+            resultat[0::2] = demi_data
+            resultat[1::2] = moyennes.astype(np.int16)
+            if previous is not None:
+                resultat = resultat[1:]
+                
+            previous = demi_data[-1]
+            sample += len(signal)
+            block = AudioCompressor._to_channels(resultat, params['channels'])
+            profile.add('interpolate', start, bytes_in=signal.nbytes, bytes_out=block.nbytes)
+            yield position, block
+            position += len(resultat)
+            
+        # Un signal de longueur paire se termine par une copie du dernier échantillon
+        if previous is not None and sample == params['total_samples'] and sample % 2 == 0:
+            resultat = np.array([previous]).astype(dtype)
+            yield position, AudioCompressor._to_channels(resultat, params['channels'])
+    
+    @staticmethod
+    def _profile_blocks(blocks, stats: dict, profile: Profile, input_path: str):
+        """
+        Complète `stats` à la fin de la décompression (blocs rendus inchangés)
+        
+        Args:
+            blocks: Générateur de (position, bloc)
+            stats: Dict à compléter
+            profile: Profil de la décompression
+            input_path: Chemin du fichier compressé (pour le journal)
+            
+        Yields:
+            tuple: (position, bloc)
+        """
+        output_bytes = 0
+        for position, block in blocks:
+            output_bytes += block.nbytes
+            yield position, block
+        stats.update(profile.result(), output_bytes=output_bytes)
+        profile.log('decompress', input_path)
+    
+    @staticmethod
+    def _progress_blocks(blocks, progress: Progress, first: int, end: int, channels: int):
+        """
+        Rapporte la part de la plage [first, end) déjà décodée (blocs rendus inchangés)
+        
+        Args:
+            blocks: Générateur de (position, bloc) limités à la plage
+            progress: Suivi de l'avancement (étage 'decode')
+            first: Première trame audio de la plage
+            end: Trame audio de fin (exclue)
+            channels: Nombre de canaux
+            
+        Yields:
+            tuple: (position, bloc)
+        """
+        progress.update('decode', 0.0)
+        for position, block in blocks:
+            progress.update('decode', (position + len(block) // channels - first) / (end - first))
+            yield position, block
+    
+    @staticmethod
+    def _trim_blocks(blocks, first: int, end: int, channels: int):
+        """
+        Restreint des blocs PCM aux trames audio [first, end)
+        
+        Args:
+            blocks: Générateur de (position, bloc)
+            first: Première trame audio conservée
+            end: Trame audio de fin (exclue)
+            channels: Nombre de canaux
+            
+        Yields:
+            tuple: (position, bloc) limités à la plage
+        """
+        for position, block in blocks:
+            block_end = position + len(block) // channels
+            if block_end <= first:
+                continue
+            if position >= end:
+                break
+            start = max(first, position)
+            yield start, block[(start - position) * channels:(min(end, block_end) - position) * channels]
+            if block_end >= end:
+                break
+    
+    @staticmethod
+    def _to_channels(resultat: np.ndarray, channels: int) -> np.ndarray:
+        """Reconstruction stéréo d'un bloc interpolé"""
+        if channels == 2:
+            return Back_to_real_stereo(resultat, 'm')
+        return resultat
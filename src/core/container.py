@@ -0,0 +1,665 @@
+"""
+Module du format de fichier .IRM
+Conteneur versionné avec sommes de contrôle (version 3), lecture des
+fichiers de la version d'origine (version 1)
+
+Version 1 (un seul flux, fichiers de la version d'origine):
+    header '!IIIffIIII' | taille table (I) | table | flux Huffman
+    table: zlib(pickle({"valeur,nombre": "0101..."}))
+
+Version 3 (sections avec CRC32):
+    b'IRM' | version (B) | nombre de sections (H) | table des sections | CRC32 de l'en-tête (I)
+    section: type (4s) | position (Q) | taille (Q) | CRC32 (I)
+    PARM: paramètres du flux
+    DATA: trame 0 | trame 1 | ... (chaque trame porte sa table et son flux)
+    INDX: nombre de trames (I) | (position (Q), CRC32 (I)) de chaque trame
+"""
+
+import io
+import mmap
+import pickle
+import struct
+import zlib
+from contextlib import contextmanager
+from functools import wraps
+import numpy as np
+from bitarray import bitarray
+
+from compression.quantification import (
+    compute_mean, normalisation, quantification,
+    dequantification, denormalisation, decompute_mean
+)
+from compression.encoding import delta_encode, delta_decode, huffman_decode_rle, rle_decode
+from compression.entropy import get_coder, get_coder_by_id, encode_residuals
+from core.profiling import NO_PROFILE, Profile
+
+
+MAGIC = b'IRM'
+FORMAT_VERSION = 3
+
+# Nombre de niveaux de quantification
+LEVELS = 256
+
+V1_HEADER = struct.Struct('!IIIffIIII')
+
+# magic, version, nombre de sections
+PREFIX = struct.Struct('!3sBH')
+
+# type, position, taille, CRC32
+SECTION = struct.Struct('!4sQQI')
+SECTION_TYPES = (b'PARM', b'DATA', b'INDX')
+
+# framerate, bits, channels, frame_width, échantillons originaux,
+# échantillons codés, échantillons par trame, mode stéréo
+PARAMS = struct.Struct('!IIIIIIIc')
+
+# Taille fixe de l'en-tête version 3: les trames commencent juste après
+PARAMS_OFFSET = PREFIX.size + len(SECTION_TYPES) * SECTION.size + 4
+HEADER_SIZE = PARAMS_OFFSET + PARAMS.size
+
+# Entrée de l'index version 3
+INDEX_ENTRY = np.dtype([('offset', '>u8'), ('crc', '>u4')])
+
+# échantillons, échelle (max), moyenne, codeur, symboles, taille table, taille flux
+FRAME_HEADER = struct.Struct('!IffBIII')
+
+
+def _checked(function):
+    """Signale un fichier mal formé par ValueError (et non zlib.error ou struct.error)"""
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        except (zlib.error, struct.error) as error:
+            raise ValueError(f"Fichier .IRM mal formé: {error}") from error
+    return wrapper
+
+
+@contextmanager
+def map_file(path: str):
+    """
+    Projette un fichier .IRM en mémoire (lecture seule, sans copie).
+    
+    Les pages sont lues à la demande et partagées par le cache du système
+    entre les lecteurs du même fichier. Les vues obtenues (tranches,
+    bitarray, np.frombuffer) doivent être libérées avant la sortie du bloc,
+    sinon la projection n'est fermée qu'à leur destruction.
+    
+    Args:
+        path: Chemin du fichier
+        
+    Yields:
+        memoryview: Contenu du fichier
+        
+    Raises:
+        ValueError: Si le fichier est vide
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            raise ValueError("Fichier .IRM vide")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # Une vue est encore référencée (trace d'une exception en cours):
+            # la projection sera libérée avec elle
+            pass
+
+
+def is_framed(buffer) -> bool:
+    """
+    Indique si un fichier utilise le conteneur par trames (version 3).
+    
+    Un fichier version 1 commence par la fréquence d'échantillonnage sur
+    32 bits: b'IRM' + version correspondrait à plus d'un milliard de Hz.
+    """
+    return bytes(buffer[:3]) == MAGIC
+
+
+def pack_header(params: dict, data: tuple, index: tuple) -> bytes:
+    """
+    Sérialise l'en-tête version 3 (table des sections et paramètres).
+    
+    Args:
+        params: framerate, bits, channels, frame_width, original_samples,
+                total_samples, frame_samples, stereo_mode
+        data: (position, taille, CRC32) de la section des trames
+        index: (position, taille, CRC32) de l'index
+                
+    Returns:
+        bytes: En-tête sérialisé (HEADER_SIZE octets)
+    """
+    parm = PARAMS.pack(
+        params['framerate'], params['bits'], params['channels'], params['frame_width'],
+        params['original_samples'], params['total_samples'], params['frame_samples'],
+        params['stereo_mode'].encode()
+    )
+    sections = [(PARAMS_OFFSET, len(parm), zlib.crc32(parm)), data, index]
+    table = b''.join([PREFIX.pack(MAGIC, FORMAT_VERSION, len(SECTION_TYPES))] +
+                     [SECTION.pack(kind, *section) for kind, section in zip(SECTION_TYPES, sections)])
+    return b''.join([table, struct.pack('!I', zlib.crc32(table)), parm])
+
+
+def read_header(buffer) -> tuple:
+    """
+    Relit et vérifie l'en-tête version 3.
+    
+    Args:
+        buffer: Contenu du fichier
+        
+    Returns:
+        tuple: (paramètres du flux, {type: (position, taille, CRC32)})
+        
+    Raises:
+        ValueError: Si l'en-tête, la table des sections ou les paramètres sont invalides
+    """
+    if len(buffer) < PREFIX.size:
+        raise ValueError("Fichier .IRM tronqué")
+    magic, version, num_sections = PREFIX.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Fichier .IRM invalide")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Version de fichier .IRM non supportée: {version}")
+        
+    table_size = PREFIX.size + num_sections * SECTION.size
+    if len(buffer) < table_size + 4:
+        raise ValueError("Fichier .IRM tronqué")
+    if zlib.crc32(buffer[:table_size]) != struct.unpack_from('!I', buffer, table_size)[0]:
+        raise ValueError("En-tête .IRM corrompu")
+        
+    sections = {}
+    for i in range(num_sections):
+        kind, offset, size, crc = SECTION.unpack_from(buffer, PREFIX.size + i * SECTION.size)
+        if offset + size > len(buffer):
+            raise ValueError(f"Section {kind.decode(errors='replace')} tronquée")
+        sections[kind] = (offset, size, crc)
+    for kind in SECTION_TYPES:
+        if kind not in sections:
+            raise ValueError(f"Section {kind.decode()} absente")
+            
+    offset, size, crc = sections[b'PARM']
+    if size != PARAMS.size or zlib.crc32(buffer[offset:offset + size]) != crc:
+        raise ValueError("Paramètres .IRM corrompus")
+    (framerate, bits, channels, frame_width,
+     original_samples, total_samples, frame_samples, stereo_mode) = PARAMS.unpack_from(buffer, offset)
+     
+    params = {
+        'version': version,
+        'framerate': framerate,
+        'bits': bits,
+        'channels': channels,
+        'frame_width': frame_width,
+        'original_samples': original_samples,
+        'total_samples': total_samples,
+        'frame_samples': frame_samples,
+        'stereo_mode': stereo_mode.decode(),
+    }
+    return params, sections
+
+
+def write_frames(f, params: dict, frames, profile: Profile = NO_PROFILE) -> tuple:
+    """
+    Écrit un conteneur version 3 dans un fichier ouvert.
+    
+    Les trames sont écrites au fil de l'eau, avec le calcul de leurs CRC32;
+    l'en-tête (de taille fixe) est écrit en dernier: `params` peut être
+    complété pendant l'itération de `frames`.
+    
+    Args:
+        f: Fichier ouvert en écriture binaire (avec seek)
+        params: Paramètres du flux (voir `pack_header`)
+        frames: Trames sérialisées par `encode_frame` (itérable)
+        profile: Profil de mesure (étage 'write')
+        
+    Returns:
+        tuple: (nombre de trames, taille du fichier en octets)
+    """
+    f.write(bytes(HEADER_SIZE))
+    offsets = []
+    crcs = []
+    data_crc = 0
+    for frame in frames:
+        start = profile.start()
+        offsets.append(f.tell())
+        crcs.append(zlib.crc32(frame))
+        data_crc = zlib.crc32(frame, data_crc)
+        f.write(frame)
+        profile.add('write', start, bytes_out=len(frame))
+        
+    start = profile.start()
+    index_offset = f.tell()
+    index = pack_index(offsets, crcs)
+    f.write(index)
+    size = f.tell()
+    
+    f.seek(0)
+    f.write(pack_header(params,
+                        (HEADER_SIZE, index_offset - HEADER_SIZE, data_crc),
+                        (index_offset, len(index), zlib.crc32(index))))
+    f.seek(size)
+    profile.add('write', start, bytes_out=HEADER_SIZE + len(index))
+    return len(offsets), size
+
+
+def pack_index(offsets: list, crcs: list) -> bytes:
+    """
+    Sérialise l'index version 3 (position et CRC32 de chaque trame).
+    
+    Args:
+        offsets: Position de chaque trame
+        crcs: CRC32 de chaque trame
+        
+    Returns:
+        bytes: Index sérialisé
+    """
+    entries = np.empty(len(offsets), dtype=INDEX_ENTRY)
+    entries['offset'] = offsets
+    entries['crc'] = crcs
+    return struct.pack('!I', len(offsets)) + entries.tobytes()
+
+
+@_checked
+def read_layout(buffer) -> tuple:
+    """
+    Relit les paramètres et l'index d'un fichier par trames (version 3).
+    
+    Seuls l'en-tête et l'index sont lus: avec un fichier projeté en mémoire
+    (mmap), les trames ne sont pas chargées.
+    
+    Args:
+        buffer: Contenu du fichier (bytes, mmap ou memoryview)
+        
+    Returns:
+        tuple: (paramètres du flux, bornes des trames, CRC32 des trames)
+               Les bornes sont la position de chaque trame puis la fin de
+               la dernière.
+               
+    Raises:
+        ValueError: Si l'en-tête ou l'index est invalide
+    """
+    params, sections = read_header(buffer)
+    offset, size, crc = sections[b'INDX']
+    if size < 4 or zlib.crc32(buffer[offset:offset + size]) != crc:
+        raise ValueError("Index .IRM corrompu")
+    num_frames = struct.unpack_from('!I', buffer, offset)[0]
+    if 4 + num_frames * INDEX_ENTRY.itemsize != size:
+        raise ValueError("Index .IRM corrompu")
+        
+    entries = np.frombuffer(buffer, dtype=INDEX_ENTRY, count=num_frames, offset=offset + 4)
+    data_offset, data_size, _ = sections[b'DATA']
+    bounds = np.append(entries['offset'].astype(np.int64), data_offset + data_size)
+    crcs = entries['crc'].astype(np.int64)
+    del entries
+    if np.any(np.diff(bounds) < 0) or (num_frames and bounds[0] != data_offset):
+        raise ValueError("Index .IRM corrompu")
+    return params, bounds, crcs
+
+
+@_checked
+def read_info(buffer) -> dict:
+    """
+    Décrit un fichier .IRM à partir de ses en-têtes, sans décoder les trames.
+    
+    Args:
+        buffer: Contenu du fichier (bytes, mmap ou memoryview)
+        
+    Returns:
+        dict: Paramètres du flux, plus 'frames' (nombre de trames) et
+              'coder' (codeur entropique de la première trame)
+              
+    Raises:
+        ValueError: Si l'en-tête ou l'index est invalide
+    """
+    if not is_framed(buffer):
+        if len(buffer) < V1_HEADER.size + 4:
+            raise ValueError("Fichier .IRM tronqué")
+        _, length, _, _, _, bits, channels, framerate, frame_width = V1_HEADER.unpack_from(buffer)
+        return {
+            'version': 1,
+            'framerate': framerate,
+            'bits': bits,
+            'channels': channels,
+            'frame_width': frame_width,
+            'total_samples': length,
+            'frames': 1,
+            # La version d'origine n'avait que le codeur de Huffman
+            'coder': 'huffman',
+        }
+        
+    params, bounds, _ = read_layout(buffer)
+    coder = None
+    if len(bounds) > 1 and bounds[1] - bounds[0] >= FRAME_HEADER.size:
+        coder = get_coder_by_id(FRAME_HEADER.unpack_from(buffer, bounds[0])[3]).name
+    return dict(params, frames=len(bounds) - 1, coder=coder)
+
+
+@_checked
+def verify(buffer) -> int:
+    """
+    Vérifie l'intégrité d'un fichier .IRM sans décodage entropique.
+    
+    Version 3: CRC32 de l'en-tête, des paramètres, de l'index et des trames
+    (une seule passe sur les données), puis cohérence des en-têtes de trame
+    avec l'index. Version 1 (sans somme de contrôle): structure et table
+    seulement.
+    
+    Args:
+        buffer: Contenu du fichier
+        
+    Returns:
+        int: Nombre de trames vérifiées (1 pour un fichier version 1)
+        
+    Raises:
+        ValueError: Au premier défaut trouvé
+    """
+    if not is_framed(buffer):
+        if len(buffer) < V1_HEADER.size + 4:
+            raise ValueError("Fichier .IRM tronqué")
+        table_size = struct.unpack_from('!I', buffer, V1_HEADER.size)[0]
+        if table_size == 0 or V1_HEADER.size + 4 + table_size > len(buffer):
+            raise ValueError("Table .IRM tronquée")
+        # Table relue (sans décodage du flux)
+        start = V1_HEADER.size + 4
+        _load_legacy_codebook(bytes(buffer[start:start + table_size]))
+        return 1
+        
+    params, bounds, crcs = read_layout(buffer)
+    offset, size, crc = read_header(buffer)[1][b'DATA']
+    if zlib.crc32(buffer[offset:offset + size]) != crc:
+        # Trame fautive, pour le message d'erreur
+        for number, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if zlib.crc32(buffer[start:end]) != crcs[number]:
+                raise ValueError(f"Trame .IRM {number} corrompue")
+        raise ValueError("Trames .IRM corrompues")
+            
+    total = 0
+    for number, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        if end - start < FRAME_HEADER.size:
+            raise ValueError(f"Trame .IRM {number} tronquée")
+        num_samples, _, _, _, _, table_size, payload_size = FRAME_HEADER.unpack_from(buffer, start)
+        if FRAME_HEADER.size + table_size + payload_size != end - start:
+            raise ValueError(f"Trame .IRM {number} incohérente avec l'index")
+        total += num_samples
+    if total != params['total_samples']:
+        raise ValueError("Nombre d'échantillons .IRM incohérent")
+    return len(bounds) - 1
+
+
+def encode_frame(samples: np.ndarray, coder: str, profile: Profile = NO_PROFILE,
+                 reconstruct: bool = False):
+    """
+    Encode une trame de façon indépendante.
+    
+    Chaque trame a sa propre moyenne, son propre maximum et sa propre table
+    entropique: elle peut être décodée sans les autres.
+    
+    Avec `reconstruct`, le signal que rendra `decode_frame` est calculé
+    directement à partir des valeurs quantifiées (le codage delta et
+    entropique est sans perte), sans décoder la trame.
+    
+    Args:
+        samples: Échantillons (sous-échantillonnés) de la trame
+        coder: Nom du codeur entropique
+        profile: Profil de mesure (étages 'quantize', 'delta', 'entropy', 'reconstruct')
+        reconstruct: Rend aussi le signal reconstruit
+        
+    Returns:
+        bytes: Trame sérialisée (en-tête + table + flux), ou
+               tuple (trame sérialisée, signal reconstruit) avec `reconstruct`
+    """
+    entropy_coder = get_coder(coder)
+    
+    start = profile.start()
+    quantized, max_val, mean = quantize_frame(samples)
+    profile.add('quantize', start, bytes_in=samples.nbytes, bytes_out=quantized.nbytes)
+    
+    start = profile.start()
+    residuals = delta_encode(quantized)
+    profile.add('delta', start, bytes_in=quantized.nbytes, bytes_out=residuals.nbytes)
+    
+    start = profile.start()
+    entropy_coder, num_symbols, table, payload = encode_residuals(entropy_coder, residuals)
+    table_symbols = entropy_coder.table_symbols(table) if profile.enabled else 0
+    table = zlib.compress(table)
+    profile.add('entropy', start, bytes_in=residuals.nbytes, bytes_out=len(table) + len(payload),
+                symbols=num_symbols, table_bytes=len(table), table_symbols=table_symbols)
+    
+    header = FRAME_HEADER.pack(len(samples), max_val, mean, entropy_coder.coder_id,
+                               num_symbols, len(table), len(payload))
+    frame = b''.join([header, table, payload])
+    if not reconstruct:
+        return frame
+        
+    # Maximum et moyenne arrondis comme dans l'en-tête (float32)
+    start = profile.start()
+    _, max_val, mean = FRAME_HEADER.unpack(header)[:3]
+    signal = dequantize_frame(quantized, max_val, mean)
+    profile.add('reconstruct', start, bytes_in=quantized.nbytes, bytes_out=signal.nbytes)
+    return frame, signal
+
+
+def profile_encode_frame(samples: np.ndarray, coder: str, reconstruct: bool = False) -> tuple:
+    """
+    Encode une trame avec un profil propre (pour un processus du pool).
+    
+    Returns:
+        tuple: (résultat d'encode_frame, étages du profil) à fusionner avec Profile.merged
+    """
+    profile = Profile()
+    return encode_frame(samples, coder, profile, reconstruct), profile.stages
+
+
+def quantize_frame(samples: np.ndarray) -> tuple:
+    """
+    Centre, normalise et quantifie une trame sur LEVELS niveaux.
+    
+    Args:
+        samples: Échantillons (sous-échantillonnés) de la trame
+        
+    Returns:
+        tuple: (valeurs quantifiées, maximum, moyenne), inverse de `dequantize_frame`
+    """
+    centered, mean = compute_mean(samples)
+    normalized, max_val = normalisation(centered)
+    return quantification(normalized, LEVELS), max_val, mean
+
+
+def dequantize_frame(quantized: np.ndarray, max_val: float, mean: float) -> np.ndarray:
+    """
+    Signal reconstruit à partir des valeurs quantifiées d'une trame.
+    
+    Args:
+        quantized: Valeurs quantifiées [0, LEVELS-1]
+        max_val: Maximum de la trame (voir normalisation)
+        mean: Moyenne de la trame (voir compute_mean)
+    
+    Returns:
+        np.ndarray: Signal reconstruit (float)
+    """
+    dequantized = dequantification(quantized, LEVELS)
+    denormalized = denormalisation(dequantized, max_val)
+    return decompute_mean(denormalized, mean)
+
+
+@_checked
+def decode_frame(buffer, offset: int, profile: Profile = NO_PROFILE) -> tuple:
+    """
+    Décode la trame qui commence à `offset`.
+    
+    Args:
+        buffer: Contenu du fichier
+        offset: Position de la trame
+        profile: Profil de mesure (étages 'entropy', 'delta', 'dequantize')
+        
+    Returns:
+        tuple: (signal reconstruit (float), position de la trame suivante)
+    """
+    num_samples, max_val, mean, coder_id, num_symbols, table_size, payload_size = \
+        FRAME_HEADER.unpack_from(buffer, offset)
+    timer = profile.start()
+    buffer = memoryview(buffer)
+    start = offset + FRAME_HEADER.size
+    table = zlib.decompress(buffer[start:start + table_size])
+    start += table_size
+    payload = buffer[start:start + payload_size]
+    if len(payload) != payload_size:
+        raise ValueError("Trame .IRM tronquée")
+        
+    residuals = get_coder_by_id(coder_id).decode(table, payload, num_symbols, num_samples)
+    profile.add('entropy', timer, bytes_in=table_size + payload_size, bytes_out=residuals.nbytes,
+                symbols=num_symbols)
+                
+    timer = profile.start()
+    pcm_data = delta_decode(residuals)
+    profile.add('delta', timer, bytes_in=residuals.nbytes, bytes_out=pcm_data.nbytes)
+    
+    timer = profile.start()
+    signal = dequantize_frame(pcm_data, max_val, mean)
+    profile.add('dequantize', timer, bytes_in=pcm_data.nbytes, bytes_out=signal.nbytes)
+    return signal, start + payload_size
+
+
+def read_frames(buffer, bounds: np.ndarray, first: int = 0, last: int = None, crcs: np.ndarray = None):
+    """
+    Découpe les trames `first` à `last` (exclue) une par une.
+    
+    Sur une memoryview, chaque trame est une vue sans copie. Chaque trame
+    peut ensuite être décodée seule avec `decode_frame_bytes` (convertie en
+    bytes pour être envoyée à un autre processus).
+    
+    Args:
+        buffer: Contenu du fichier (bytes ou memoryview)
+        bounds: Bornes des trames (voir `read_layout`)
+        first: Première trame à lire
+        last: Trame de fin (exclue, par défaut: toutes)
+        crcs: CRC32 des trames, vérifiés avant de les rendre
+        
+    Yields:
+        Octets de chaque trame, dans l'ordre
+        
+    Raises:
+        ValueError: Si le CRC32 d'une trame ne correspond pas
+    """
+    last = len(bounds) - 1 if last is None else last
+    for number in range(first, last):
+        start, end = bounds[number], bounds[number + 1]
+        if crcs is not None and zlib.crc32(buffer[start:end]) != crcs[number]:
+            raise ValueError(f"Trame .IRM {number} corrompue")
+        yield buffer[start:end]
+
+
+def decode_frame_bytes(frame: bytes, profile: Profile = NO_PROFILE) -> np.ndarray:
+    """
+    Décode une trame isolée (voir `read_frames`).
+    
+    Args:
+        frame: Octets de la trame
+        profile: Profil de mesure
+        
+    Returns:
+        np.ndarray: Signal reconstruit (float)
+    """
+    return decode_frame(frame, 0, profile)[0]
+
+
+def profile_decode_frame(frame: bytes) -> tuple:
+    """
+    Décode une trame isolée avec un profil propre (pour un processus du pool).
+    
+    Returns:
+        tuple: (signal reconstruit, étages du profil) à fusionner avec Profile.merged
+    """
+    profile = Profile()
+    return decode_frame_bytes(frame, profile), profile.stages
+
+
+class _CodebookUnpickler(pickle.Unpickler):
+    """Relit la table pickle d'un fichier d'origine: aucune classe n'est chargée"""
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Objet interdit dans une table .IRM: {module}.{name}")
+
+
+def _load_legacy_codebook(table) -> dict:
+    """
+    Relit la table de Huffman d'un fichier version 1.
+    
+    Le pickle est relu sans charger aucune classe: seuls les types de base
+    (dict, str) sont acceptés, un fichier forgé ne peut exécuter aucun code.
+    
+    Args:
+        table: Table compressée par zlib
+        
+    Returns:
+        dict: {"valeur,nombre": code binaire}
+        
+    Raises:
+        ValueError: Si la table est illisible ou n'a pas la forme attendue
+    """
+    try:
+        codebook = _CodebookUnpickler(io.BytesIO(zlib.decompress(table))).load()
+    except Exception as error:
+        # zlib et un pickle corrompu lèvent des exceptions de types variés
+        raise ValueError(f"Table .IRM illisible: {error}") from error
+    if not isinstance(codebook, dict) or not all(
+            isinstance(symbol, str) and isinstance(code, str) for symbol, code in codebook.items()):
+        raise ValueError("Table .IRM d'origine invalide")
+    return codebook
+
+
+@_checked
+def decode_v1(buffer, profile: Profile = NO_PROFILE) -> tuple:
+    """
+    Décode un fichier version 1 (flux unique écrit par la version d'origine).
+    
+    Args:
+        buffer: Contenu du fichier
+        profile: Profil de mesure
+        
+    Returns:
+        tuple: (paramètres du flux, signal reconstruit (float))
+        
+    Raises:
+        ValueError: Si le fichier est tronqué ou sa table illisible
+    """
+    if len(buffer) < V1_HEADER.size + 4:
+        raise ValueError("Fichier .IRM tronqué")
+    sample_rate, length, num_pairs, max_val, mean, bits, channels, framerate, frame_width = \
+        V1_HEADER.unpack_from(buffer)
+    table_size = struct.unpack_from('!I', buffer, V1_HEADER.size)[0]
+    start = V1_HEADER.size + 4
+    if table_size == 0 or start + table_size > len(buffer):
+        raise ValueError("Table .IRM tronquée")
+    # copie de la table: une vue restée dans une trace d'erreur empêcherait
+    # de refermer le fichier projeté
+    codebook = _load_legacy_codebook(bytes(buffer[start:start + table_size]))
+    
+    timer = profile.start()
+    encoded = bitarray()
+    encoded.frombytes(buffer[start + table_size:])
+    values, counts = huffman_decode_rle(encoded, codebook, num_pairs)
+    residuals = rle_decode(values, counts, length)
+    profile.add('entropy', timer, bytes_in=len(buffer) - start, bytes_out=residuals.nbytes,
+                symbols=num_pairs)
+                
+    timer = profile.start()
+    pcm_data = delta_decode(residuals)
+    profile.add('delta', timer, bytes_in=residuals.nbytes, bytes_out=pcm_data.nbytes)
+    
+    timer = profile.start()
+    signal = dequantize_frame(pcm_data, max_val, mean)
+    profile.add('dequantize', timer, bytes_in=pcm_data.nbytes, bytes_out=signal.nbytes)
+    params = {
+        'version': 1,
+        'framerate': framerate,
+        'bits': bits,
+        'channels': channels,
+        'frame_width': frame_width,
+        'total_samples': length,
+    }
+    return params, signal
@@ -0,0 +1,92 @@
+"""
+Module d'exécution parallèle
+Applique une fonction à une suite de trames (ou de fichiers) dans un pool de processus
+"""
+
+import os
+from collections import deque
+
+
+def resolve_workers(workers: int = None) -> int:
+    """
+    Nombre effectif de processus (None ou 0: tous les coeurs de la machine).
+    
+    Args:
+        workers: Nombre de processus demandé
+        
+    Returns:
+        int: Nombre de processus (>= 1)
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def ordered_map(function, items, workers: int = 1, max_pending: int = None):
+    """
+    Applique `function` à chaque élément et produit les résultats dans l'ordre.
+    
+    Avec plus d'un processus, les éléments sont soumis au fur et à mesure à
+    un ProcessPoolExecutor, avec au plus `max_pending` tâches en vol: la
+    mémoire reste bornée même si `items` est un générateur de longueur
+    arbitraire. Les résultats sont rendus dans l'ordre de soumission, donc
+    la sortie ne dépend pas du nombre de processus.
+    
+    Args:
+        function: Fonction de niveau module (sérialisable par pickle)
+        items: Éléments à traiter (itérable)
+        workers: Nombre de processus (1: exécution dans le processus courant)
+        max_pending: Nombre maximal de tâches en vol (défaut: 2 × workers)
+        
+    Yields:
+        Résultat de `function` pour chaque élément, dans l'ordre
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        for item in items:
+            yield function(item)
+        return
+        
+    # Import différé: inutile (et coûteux au démarrage) en exécution séquentielle
+    from concurrent.futures import ProcessPoolExecutor
+    
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def unordered_map(function, items, workers: int = 1):
+    """
+    Applique `function` à chaque élément et produit les résultats dès qu'ils sont prêts.
+    
+    Contrairement à ordered_map, un élément long ne retarde pas les
+    résultats des éléments soumis après lui: chaque processus libre prend
+    l'élément suivant. Tous les éléments sont soumis d'emblée (`items` doit
+    être de longueur raisonnable, par exemple une liste de fichiers).
+    
+    Args:
+        function: Fonction de niveau module (sérialisable par pickle)
+        items: Éléments à traiter (itérable)
+        workers: Nombre de processus (1: exécution dans le processus courant)
+        
+    Yields:
+        Résultat de `function` pour chaque élément, dans l'ordre de fin
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        for item in items:
+            yield function(item)
+        return
+        
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(function, item) for item in items]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,178 @@
+"""
+Module de lecture/écriture PCM par blocs
+Lit et écrit un fichier audio morceau par morceau sans le charger en mémoire
+"""
+
+import subprocess
+import wave
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import mediainfo
+
+
+# Types NumPy des échantillons selon leur taille en octets
+SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def open_pcm_stream(path: str) -> tuple:
+    """
+    Ouvre un fichier audio en lecture par blocs.
+    
+    Les fichiers WAV sont lus directement avec le module `wave`; les autres
+    formats sont décodés par ffmpeg et lus depuis son pipe (PCM 16 bits).
+    Seuls les en-têtes sont lus à l'ouverture: les métadonnées permettent de
+    choisir la taille des blocs avant la lecture.
+    
+    Args:
+        path: Chemin du fichier audio
+        
+    Returns:
+        tuple: (métadonnées, iter_blocks) où iter_blocks(block_frames) produit
+               des blocs entrelacés [L,R,L,R,...] de block_frames trames audio
+               (métadonnées: channels, framerate, sample_width, frame_width,
+               frames et duration en secondes)
+    """
+    try:
+        return _open_wav(path)
+    except (wave.Error, EOFError):
+        return _open_decoder_pipe(path)
+
+
+def _open_wav(path: str) -> tuple:
+    """
+    Lecture par blocs d'un fichier WAV (PCM 8, 16, 24 ou 32 bits).
+    
+    Les échantillons sont convertis comme le fait pydub: 8 bits non signés
+    vers int8, 24 bits vers int32 (octet de poids faible ajouté).
+    
+    Raises:
+        wave.Error: Si le fichier n'est pas un WAV PCM
+    """
+    with wave.open(path, 'rb') as reader:
+        sample_width = reader.getsampwidth()
+        width = 4 if sample_width == 3 else sample_width
+        metadata = {
+            'channels': reader.getnchannels(),
+            'framerate': reader.getframerate(),
+            'sample_width': width,
+            'frame_width': width * reader.getnchannels(),
+            'frames': reader.getnframes(),
+            'duration': reader.getnframes() / reader.getframerate(),
+        }
+    
+    def blocks(block_frames):
+        with wave.open(path, 'rb') as reader:
+            while True:
+                data = reader.readframes(block_frames)
+                if not data:
+                    break
+                yield _to_samples(data, sample_width)
+                
+    return metadata, blocks
+
+
+def _open_decoder_pipe(path: str) -> tuple:
+    """
+    Lecture par blocs de la sortie PCM 16 bits d'ffmpeg (formats compressés).
+    
+    Le nombre de trames n'est connu qu'à la fin du décodage ('frames' = None);
+    'duration' est celle annoncée par le conteneur (None si absente).
+    """
+    info = mediainfo(path)
+    channels = int(info.get('channels', 0))
+    framerate = int(info.get('sample_rate', 0))
+    if not channels or not framerate:
+        raise ValueError(f"Format audio non reconnu: {path}")
+        
+    metadata = {
+        'channels': channels,
+        'framerate': framerate,
+        'sample_width': 2,
+        'frame_width': 2 * channels,
+        'frames': None,
+        'duration': float(info['duration']) if info.get('duration') else None,
+    }
+    command = [AudioSegment.converter, '-v', 'error', '-i', path,
+               '-f', 's16le', '-acodec', 'pcm_s16le', '-']
+    
+    def blocks(block_frames):
+        block_bytes = block_frames * metadata['frame_width']
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            while True:
+                data = _read_exactly(process.stdout, block_bytes)
+                if not data:
+                    break
+                yield np.frombuffer(data, dtype='<i2').astype(np.int16)
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                raise RuntimeError(f"Décodage impossible: {stderr.decode(errors='replace').strip()}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.stderr.close()
+            process.wait()
+            
+    return metadata, blocks
+
+
+def write_wav_stream(path: str, blocks, channels: int, sample_width: int, framerate: int) -> int:
+    """
+    Écrit des blocs PCM dans un fichier WAV au fur et à mesure.
+    
+    Les tailles de l'en-tête sont complétées à la fermeture du fichier.
+    
+    Args:
+        path: Chemin du fichier WAV
+        blocks: Blocs d'échantillons entrelacés (itérable de np.ndarray)
+        channels: Nombre de canaux
+        sample_width: Taille d'un échantillon en octets
+        framerate: Fréquence d'échantillonnage
+        
+    Returns:
+        int: Nombre de trames audio écrites
+    """
+    with wave.open(path, 'wb') as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(framerate)
+        for block in blocks:
+            writer.writeframesraw(block.astype(block.dtype.newbyteorder('<')).tobytes())
+        return writer.tell()
+
+
+def _read_exactly(stream, size: int) -> bytes:
+    """Lit `size` octets d'un pipe (moins seulement en fin de flux)"""
+    chunks = []
+    remaining = size
+    while remaining:
+        data = stream.read(remaining)
+        if not data:
+            break
+        chunks.append(data)
+        remaining -= len(data)
+    return b''.join(chunks)
+
+
+def _to_samples(data: bytes, sample_width: int) -> np.ndarray:
+    """
+    Convertit des octets PCM little-endian en échantillons signés.
+    
+    Args:
+        data: Octets PCM lus dans le fichier
+        sample_width: Taille d'un échantillon dans le fichier (1 à 4 octets)
+        
+    Returns:
+        np.ndarray: Échantillons (int8, int16 ou int32)
+    """
+    if sample_width == 1:
+        return (np.frombuffer(data, dtype=np.uint8).astype(np.int16) - 128).astype(np.int8)
+    if sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.empty((len(raw), 4), dtype=np.uint8)
+        padded[:, 0] = np.where(raw[:, 2] > 0x7F, 0xFF, 0)
+        padded[:, 1:] = raw
+        return padded.view('<i4').reshape(-1).astype(np.int32)
+    dtype = SAMPLE_DTYPES[sample_width]
+    return np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder('<')).astype(dtype)
@@ -0,0 +1,113 @@
+"""
+Module de mesure des étages
+Durées et compteurs par étage de la compression et de la décompression
+"""
+
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Compteurs agrégés par maximum (les autres sont additionnés)
+MAX_COUNTERS = ('table_symbols',)
+
+
+class Profile:
+    """
+    Durées et compteurs cumulés par étage.
+    
+    Chaque étage est mesuré par `start()` puis `add()`; les compteurs
+    (octets en entrée/sortie, symboles...) sont cumulés avec la durée. Un
+    profil peut être transmis à un autre processus sous forme de dict
+    (`stages`) puis fusionné avec `merge()`.
+    """
+    
+    enabled = True
+    
+    def __init__(self):
+        self.created = time.perf_counter()
+        self.stages = {}
+    
+    def start(self) -> float:
+        """Instant de début d'un étage"""
+        return time.perf_counter()
+    
+    def add(self, stage: str, start: float, **counters):
+        """
+        Ajoute la durée écoulée depuis `start` et les compteurs à un étage.
+        
+        Args:
+            stage: Nom de l'étage
+            start: Valeur rendue par `start()`
+            **counters: Compteurs entiers (bytes_in, bytes_out, symbols...)
+        """
+        self.merge({stage: dict(counters, seconds=time.perf_counter() - start, calls=1)})
+    
+    def merge(self, stages: dict):
+        """Cumule les étages d'un autre profil (voir `stages`)"""
+        for stage, values in stages.items():
+            entry = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+            for key, value in values.items():
+                if key in MAX_COUNTERS:
+                    entry[key] = max(entry.get(key, 0), value)
+                else:
+                    entry[key] = entry.get(key, 0) + value
+    
+    def merged(self, results):
+        """Fusionne les profils de résultats (valeur, étages) et rend les valeurs"""
+        for value, stages in results:
+            self.merge(stages)
+            yield value
+    
+    def result(self) -> dict:
+        """
+        Résultat structuré du profil.
+        
+        Returns:
+            dict: {'seconds': durée totale, 'stages': {étage: {seconds, calls, compteurs...}}}
+        """
+        return {'seconds': time.perf_counter() - self.created, 'stages': self.stages}
+    
+    def log(self, operation: str, path: str):
+        """Journalise le résultat (INFO: total, DEBUG: un message par étage)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        result = self.result()
+        logger.info("%s %s: %.3f s", operation, path, result['seconds'],
+                    extra={'operation': operation, 'path': path, 'profile': result})
+        if logger.isEnabledFor(logging.DEBUG):
+            for stage, values in result['stages'].items():
+                counters = ' '.join(f"{key}={value}" for key, value in values.items() if key != 'seconds')
+                logger.debug("%s %s: %.4f s %s", operation, stage, values['seconds'], counters)
+
+
+class NullProfile(Profile):
+    """Profil désactivé: aucune mesure, aucun message"""
+    
+    enabled = False
+    
+    def __init__(self):
+        self.created = 0.0
+        self.stages = {}
+    
+    def start(self) -> float:
+        return 0.0
+    
+    def add(self, stage: str, start: float, **counters):
+        pass
+    
+    def merge(self, stages: dict):
+        pass
+    
+    def log(self, operation: str, path: str):
+        pass
+
+
+# Profil partagé des appels sans mesure
+NO_PROFILE = NullProfile()
+
+
+def get_profile(enabled: bool) -> Profile:
+    """Nouveau profil si `enabled`, sinon le profil désactivé partagé"""
+    return Profile() if enabled else NO_PROFILE
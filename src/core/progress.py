@@ -0,0 +1,126 @@
+"""
+Module de suivi de progression
+Rapporte l'avancement de la compression/décompression à un callback, à
+fréquence limitée, et interrompt l'opération si elle est annulée
+"""
+
+import time
+
+
+# Intervalle minimal entre deux appels du callback pour un même étage (secondes)
+PROGRESS_INTERVAL = 0.05
+
+
+class OperationCancelled(Exception):
+    """Opération interrompue à la demande (voir Progress)"""
+
+
+class Progress:
+    """
+    Avancement global (0 à 1) rapporté à `callback(étage, fraction)`.
+    
+    Les appels sont limités à un par `interval` secondes: un changement
+    d'étage et la fin (fraction 1) sont toujours transmis, les mises à jour
+    intermédiaires trop rapprochées ou répétées sont ignorées.
+    
+    L'annulation (`cancel`, par exemple un threading.Event) est vérifiée à
+    chaque mise à jour, avant la limitation: l'opération s'arrête entre deux
+    trames ou deux blocs.
+    """
+    
+    enabled = True
+    
+    def __init__(self, callback, interval: float = PROGRESS_INTERVAL, cancel=None):
+        self.callback = callback
+        self.interval = interval
+        self.cancel = cancel
+        self.stage = None
+        self.fraction = None
+        self.last = 0.0
+    
+    def update(self, stage: str, fraction: float):
+        """
+        Rapporte l'avancement global.
+        
+        Args:
+            stage: Nom de l'étage en cours
+            fraction: Avancement global, de 0 à 1
+            
+        Raises:
+            OperationCancelled: Si l'annulation a été demandée
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            raise OperationCancelled("Opération annulée")
+        fraction = min(max(fraction, 0.0), 1.0)
+        now = time.monotonic()
+        if stage == self.stage and (fraction == self.fraction
+                                    or (fraction < 1.0 and now - self.last < self.interval)):
+            return
+        self.stage = stage
+        self.fraction = fraction
+        self.last = now
+        if self.callback is not None:
+            self.callback(stage, fraction)
+    
+    def track(self, items, stage: str, total: int, start: float = 0.0, end: float = 1.0):
+        """
+        Rend les éléments de `items` en rapportant l'avancement de `start` à `end`.
+        
+        Args:
+            items: Itérable de `total` éléments (trames, blocs...)
+            stage: Nom de l'étage
+            total: Nombre d'éléments attendus (None: inconnu, seule la fin est rapportée)
+            start: Avancement global avant le premier élément
+            end: Avancement global après le dernier élément
+            
+        Yields:
+            Les éléments de `items`, inchangés
+        """
+        self.update(stage, start)
+        done = 0
+        for item in items:
+            yield item
+            done += 1
+            if total:
+                self.update(stage, start + (end - start) * min(done / total, 1.0))
+        self.update(stage, end)
+
+
+class NullProgress(Progress):
+    """Suivi désactivé: aucun appel"""
+    
+    enabled = False
+    
+    def __init__(self):
+        self.callback = None
+        self.interval = PROGRESS_INTERVAL
+        self.cancel = None
+        self.stage = None
+        self.fraction = None
+        self.last = 0.0
+    
+    def update(self, stage: str, fraction: float):
+        pass
+    
+    def track(self, items, stage: str, total: int, start: float = 0.0, end: float = 1.0):
+        return items
+
+
+# Suivi partagé des appels sans callback
+NO_PROGRESS = NullProgress()
+
+
+def get_progress(callback, cancel=None) -> Progress:
+    """
+    Suivi vers `callback(étage, fraction)` avec annulation par `cancel`.
+
+    Args:
+        callback: Callback de progression (None: aucun appel)
+        cancel: Objet dont is_set() demande l'annulation (threading.Event, None: jamais)
+        
+    Returns:
+        Progress: Suivi, ou le suivi désactivé partagé si les deux sont None
+    """
+    if callback is None and cancel is None:
+        return NO_PROGRESS
+    return Progress(callback, cancel=cancel)
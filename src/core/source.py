@@ -0,0 +1,113 @@
+"""
+Module de chargement des fichiers source
+Chaque fichier n'est décodé qu'une fois: l'audio décodé est partagé entre
+l'interface, la compression et les métriques
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pydub import AudioSegment
+
+from core.pcm_stream import open_pcm_stream
+
+
+# Nombre de fichiers décodés gardés en mémoire
+CACHE_SIZE = 2
+
+# Audio décodé par clé (voir source_key), du moins au plus récemment utilisé
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def source_key(path: str) -> tuple:
+    """
+    Clé de cache d'un fichier: un fichier modifié est décodé à nouveau.
+    
+    Args:
+        path: Chemin du fichier audio
+    
+    Returns:
+        tuple: (chemin absolu, date de modification en ns, taille en octets)
+    """
+    stat = os.stat(path)
+    return os.path.realpath(path), stat.st_mtime_ns, stat.st_size
+
+
+def cached_source(path: str) -> AudioSegment:
+    """
+    Audio décodé d'un fichier s'il est en cache, sans décodage.
+    
+    Args:
+        path: Chemin du fichier audio
+    
+    Returns:
+        AudioSegment: Audio décodé, ou None s'il n'est pas en cache
+    """
+    key = source_key(path)
+    with _lock:
+        sound = _cache.get(key)
+        if sound is not None:
+            _cache.move_to_end(key)
+        return sound
+
+
+def load_source(path: str, keep: bool = True) -> AudioSegment:
+    """
+    Audio décodé d'un fichier, décodé au premier appel seulement.
+    
+    Les `CACHE_SIZE` derniers fichiers décodés sont gardés en mémoire
+    (l'AudioSegment est partagé, il ne doit pas être modifié).
+    
+    Args:
+        path: Chemin du fichier audio
+        keep: Garde l'audio décodé en cache (False: utilise le cache sans
+              l'alimenter, pour un fichier lu une seule fois)
+    
+    Returns:
+        AudioSegment: Audio décodé
+    """
+    sound = cached_source(path)
+    if sound is not None:
+        return sound
+    
+    key = source_key(path)
+    sound = AudioSegment.from_file(path)
+    if keep:
+        with _lock:
+            # Une version précédente du même fichier n'est plus utile
+            for old in [old for old in _cache if old[0] == key[0]]:
+                del _cache[old]
+            _cache[key] = sound
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+    return sound
+
+
+def read_source_info(path: str) -> dict:
+    """
+    Format d'un fichier audio, lu dans ses en-têtes sans le décoder.
+    
+    Les fichiers WAV sont lus avec le module `wave`, les autres avec ffprobe
+    (voir open_pcm_stream).
+    
+    Args:
+        path: Chemin du fichier audio
+    
+    Returns:
+        dict: channels, framerate, sample_width (octets) et duration (secondes,
+              None si inconnue)
+    """
+    metadata, _ = open_pcm_stream(path)
+    return {
+        'channels': metadata['channels'],
+        'framerate': metadata['framerate'],
+        'sample_width': metadata['sample_width'],
+        'duration': metadata['duration'],
+    }
+
+
+def clear_sources():
+    """Vide le cache des fichiers décodés"""
+    with _lock:
+        _cache.clear()
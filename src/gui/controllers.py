@@ -3,15 +3,18 @@ Contrôleurs pour la logique de l'interface graphique
 Séparation entre UI et logique métier
 """
 
+from functools import partial
 from pathlib import Path
-from PySide6.QtWidgets import QFileDialog, QApplication
+from PySide6.QtWidgets import QFileDialog
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PySide6.QtCore import QUrl, QObject, Signal
+from PySide6.QtCore import QUrl, QObject, QThreadPool, Signal
 
 from core.compressor import AudioCompressor
 from core.audio_processor import AudioProcessor
+from core.source import load_source
 from compression.utils import taux_reduction
-from pydub import AudioSegment
+
+from .workers import CodecTask
 
 
 class AudioController(QObject):
@@ -20,10 +23,11 @@ class AudioController(QObject):
     # Signaux
     file_selected = Signal(str)  # Fichier sélectionné
     compression_started = Signal()
-    compression_progress = Signal(int)  # Progression 0-100
+    compression_progress = Signal(str, float)  # (étage, progression 0-1)
     compression_finished = Signal(float)  # Taux de compression
     compression_error = Signal(str)  # Message d'erreur
     decompression_finished = Signal(str)  # Chemin du fichier décompressé
+    busy_changed = Signal(bool)  # Tâche de compression/décompression en cours
     
     # Nouveaux signaux pour la visualisation
     original_audio_loaded = Signal(object)  # AudioSegment original
@@ -37,6 +41,13 @@ class AudioController(QObject):
         self.original_audio_segment = None
         self.compressed_audio_segment = None
         
+        # Tâche en cours (une seule à la fois): gardée jusqu'à la suivante,
+        # ses signaux peuvent encore être en cours de traitement
+        self.thread_pool = QThreadPool.globalInstance()
+        self.task = None
+        self.task_error_prefix = ""
+        self.busy = False
+        
         # Lecteur audio
         self.player = QMediaPlayer()
         self.audio_output = QAudioOutput()
@@ -65,7 +76,7 @@ class AudioController(QObject):
             
             # Charger l'audio pour la visualisation
             try:
-                self.original_audio_segment = AudioSegment.from_file(file_path)
+                self.original_audio_segment = load_source(file_path)
                 self.original_audio_loaded.emit(self.original_audio_segment)
             except Exception as e:
                 self.compression_error.emit(f"Erreur de chargement: {str(e)}")
@@ -75,7 +86,7 @@ class AudioController(QObject):
     
     def compress_file(self, parent_widget):
         """
-        Compresse le fichier sélectionné
+        Compresse le fichier sélectionné dans le pool de threads
         
         Args:
             parent_widget: Widget parent pour les dialogues
@@ -83,6 +94,8 @@ class AudioController(QObject):
         if not self.original_audio_path:
             self.compression_error.emit("Aucun fichier sélectionné")
             return
+        if self.is_busy():
+            return
         
         # Dialogue pour sauvegarder
         save_path, _ = QFileDialog.getSaveFileName(
@@ -95,44 +108,100 @@ class AudioController(QObject):
         if not save_path:
             return
         
-        try:
-            self.compression_started.emit()
-            
-            # Compression
-            stats = AudioCompressor.compress(self.original_audio_path, save_path)
-            
-            # Simulation de progression
-            for i in range(1, 101):
-                self.compression_progress.emit(i)
-                QApplication.processEvents()
+        self.compression_started.emit()
+        self._start_task(partial(self._compress_job, self.original_audio_path, save_path),
+                         self._on_compressed)
             
-            self.compressed_audio_path = save_path
-            
-            # Calcul du taux
-            taux = taux_reduction(self.original_audio_path, save_path)
-            self.compression_finished.emit(taux)
-            
-            # Décompression pour la visualisation
-            try:
-                self.compressed_audio_segment = AudioCompressor.decompress(save_path)
-                self.compressed_audio_loaded.emit(self.compressed_audio_segment)
+    @staticmethod
+    def _compress_job(input_path: str, save_path: str, progress, cancel) -> dict:
+        """
+        Compression (exécutée hors du thread de l'interface)
+        
+        L'audio de la visualisation est reconstruit pendant l'encodage: le
+        fichier compressé n'est ni relu ni décodé.
+        
+        Returns:
+            dict: Chemin, taux, audio reconstruit et métriques (audio None si la
+                  visualisation a échoué)
+        """
+        stats = AudioCompressor.compress(input_path, save_path, progress=progress, cancel=cancel,
+                                         reconstruct=True)
+        result = {'path': save_path, 'taux': taux_reduction(input_path, save_path), 'audio': None}
+        
+        # Métriques pour la visualisation
+        try:
+            audio = stats['audio']
+            result['original_info'] = AudioProcessor.get_file_info(input_path)
+            result['compressed_info'] = {
+                'size': Path(save_path).stat().st_size,
+                'duration': len(audio) / 1000.0,
+                'channels': audio.channels,
+                'sample_rate': audio.frame_rate,
+                'sample_width': audio.sample_width
+            }
+            result['audio'] = audio
+        except Exception as e:
+            print(f"Erreur de visualisation: {str(e)}")
+        
+        return result
+    
+    def _on_compressed(self, result: dict):
+        """Fin de compression (thread de l'interface)"""
+        self.compressed_audio_path = result['path']
+        self.compression_finished.emit(result['taux'])
+        
+        if result['audio'] is not None:
+            self.compressed_audio_segment = result['audio']
+            self.compressed_audio_loaded.emit(self.compressed_audio_segment)
                 
-                # Mise à jour des métriques
-                original_info = AudioProcessor.get_file_info(self.original_audio_path)
-                compressed_info = {
-                    'size': Path(save_path).stat().st_size,
-                    'duration': len(self.compressed_audio_segment) / 1000.0,
-                    'channels': self.compressed_audio_segment.channels,
-                    'sample_rate': self.compressed_audio_segment.frame_rate,
-                    'sample_width': self.compressed_audio_segment.sample_width
-                }
-                self.metrics_updated.emit(original_info, compressed_info, taux)
+            # Mise à jour des métriques
+            self.metrics_updated.emit(result['original_info'], result['compressed_info'],
+                                      result['taux'])
                 
-            except Exception as e:
-                print(f"Erreur de visualisation: {str(e)}")
-            
-        except Exception as e:
-            self.compression_error.emit(str(e))
+    def _start_task(self, function, on_finished, error_prefix: str = ""):
+        """
+        Lance une tâche dans le pool de threads
+        
+        Args:
+            function: Fonction function(progress, cancel), voir CodecTask
+            on_finished: Slot appelé avec le résultat dans le thread de l'interface
+            error_prefix: Préfixe des messages d'erreur
+        """
+        self.task = CodecTask(function)
+        self.task_error_prefix = error_prefix
+        self.task.signals.progress.connect(self.compression_progress)
+        self.task.signals.finished.connect(on_finished)
+        self.task.signals.failed.connect(self._on_task_failed)
+        self.task.signals.cancelled.connect(self._on_task_cancelled)
+        for signal in (self.task.signals.finished, self.task.signals.failed,
+                       self.task.signals.cancelled):
+            signal.connect(self._on_task_done)
+        
+        self.busy = True
+        self.busy_changed.emit(True)
+        self.thread_pool.start(self.task)
+    
+    def _on_task_failed(self, message: str):
+        """Erreur de la tâche en cours"""
+        self.compression_error.emit(self.task_error_prefix + message)
+    
+    def _on_task_cancelled(self):
+        """Annulation de la tâche en cours"""
+        self.compression_error.emit("Opération annulée")
+    
+    def _on_task_done(self, *args):
+        """Fin de la tâche en cours"""
+        self.busy = False
+        self.busy_changed.emit(False)
+    
+    def is_busy(self) -> bool:
+        """True si une compression/décompression est en cours"""
+        return self.busy
+    
+    def cancel(self):
+        """Annule la tâche en cours (effective au prochain bloc)"""
+        if self.busy:
+            self.task.cancel()
     
     def play_original(self):
         """Lit le fichier audio original"""
@@ -154,30 +223,43 @@ class AudioController(QObject):
             "Fichiers IRM (*.IRM)"
         )
         
-        if not file_path:
+        if not file_path or self.is_busy():
             return
         
-        try:
-            # Décompression
-            audio = AudioCompressor.decompress(file_path)
+        self._start_task(partial(self._decompress_job, file_path), self._on_decompressed,
+                         "Erreur de décompression: ")
             
-            # Export temporaire
-            temp_file = AudioProcessor.export_for_playback(audio)
-            
-            # Lecture
-            self.player.setSource(QUrl.fromLocalFile(temp_file))
-            self.player.play()
+    @staticmethod
+    def _decompress_job(file_path: str, progress, cancel) -> tuple:
+        """
+        Décompression et export temporaire (exécuté hors du thread de l'interface)
+        
+        Returns:
+            tuple: (fichier .IRM, fichier temporaire à lire)
+        """
+        audio = AudioCompressor.decompress(file_path, progress=progress, cancel=cancel)
+        return file_path, AudioProcessor.export_for_playback(audio)
+    
+    def _on_decompressed(self, result: tuple):
+        """Fin de décompression: lecture (thread de l'interface)"""
+        file_path, temp_file = result
+        self.player.setSource(QUrl.fromLocalFile(temp_file))
+        self.player.play()
             
-            self.decompression_finished.emit(Path(file_path).name)
+        self.decompression_finished.emit(Path(file_path).name)
             
-        except Exception as e:
-            self.compression_error.emit(f"Erreur de décompression: {str(e)}")
-    
     def stop_playback(self):
         """Arrête la lecture"""
         self.player.stop()
     
+    def stop(self):
+        """Annule la tâche en cours et arrête la lecture"""
+        self.cancel()
+        self.player.stop()
+    
     def cleanup(self):
         """Nettoie les ressources"""
+        self.cancel()
+        self.thread_pool.waitForDone()
         self.player.stop()
         AudioProcessor.cleanup_temp_files()
\ No newline at end of file
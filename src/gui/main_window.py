@@ -2,6 +2,8 @@
 Fenêtre principale de l'application avec design optimisé
 """
 
+import logging
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea
 )
@@ -17,6 +19,9 @@ from .visualization_widget import VisualizationFrame
 from .controllers import AudioController
 
 
+logger = logging.getLogger(__name__)
+
+
 class AudioCompressorWindow(QMainWindow):
     """Fenêtre principale optimisée"""
     
@@ -139,7 +144,7 @@ class AudioCompressorWindow(QMainWindow):
         # Arrêt
         self.stop_frame = ControlFrame("⏹️ CONTRÔLE")
         self.stop_btn = StyledButton("ARRÊTER", AppStyles.COLORS['gray'])
-        self.stop_btn.clicked.connect(self.controller.stop_playback)
+        self.stop_btn.clicked.connect(self.controller.stop)
         self.stop_frame.add_button(self.stop_btn)
         
         controls_layout.addWidget(self.original_frame)
@@ -157,6 +162,7 @@ class AudioCompressorWindow(QMainWindow):
 
         self.controller.compression_error.connect(self._on_compression_error)
         self.controller.decompression_finished.connect(self._on_decompression_finished)
+        self.controller.busy_changed.connect(self._on_busy_changed)
         
         # Signaux de visualisation
         self.controller.original_audio_loaded.connect(self._on_original_loaded)
@@ -165,56 +171,64 @@ class AudioCompressorWindow(QMainWindow):
     
     def _on_file_selected(self, filename: str):
         """Callback: fichier sélectionné"""
-        print(f"[DEBUG] Fichier sélectionné: {filename}")
+        logger.debug("Fichier sélectionné: %s", filename)
         self.file_frame.set_file_name(filename)
         self.progress_bar.setValue(100)
         self.info_label.clear_message()
     
     def _on_compression_started(self):
         """Callback: compression démarrée"""
-        print("[DEBUG] Compression démarrée")
+        logger.debug("Compression démarrée")
         self.progress_bar.reset()
         self.info_label.clear_message()
     
-    def _on_compression_progress(self, value: int):
+    def _on_compression_progress(self, stage: str, fraction: float):
         """Callback: progression de la compression"""
-        self.progress_bar.setValue(value)
+        self.progress_bar.set_progress(fraction, stage)
     
    
     
     def _on_compression_error(self, message: str):
         """Callback: erreur de compression"""
-        print(f"[DEBUG] Erreur: {message}")
+        logger.debug("Erreur: %s", message)
         self.info_label.show_error(message)
     
     def _on_decompression_finished(self, filename: str):
         """Callback: décompression terminée"""
-        print(f"[DEBUG] Décompression terminée: {filename}")
+        logger.debug("Décompression terminée: %s", filename)
         self.info_label.show_success(f"Lecture de {filename}")
     
+    def _on_busy_changed(self, busy: bool):
+        """Callback: tâche démarrée/terminée (une seule à la fois)"""
+        self.compress_btn.setEnabled(not busy)
+        self.play_compressed_btn.setEnabled(not busy)
+    
     def _on_original_loaded(self, audio_segment):
         """Callback: audio original chargé"""
-        print("[DEBUG] Callback: Audio original chargé")
+        logger.debug("Audio original chargé")
         self.viz_frame.set_original_audio(audio_segment)
     
     def _on_compressed_loaded(self, audio_segment):
         """Callback: audio compressé chargé"""
-        print("[DEBUG] Callback: Audio compressé chargé")
+        logger.debug("Audio compressé chargé")
         self.viz_frame.set_compressed_audio(audio_segment)
     
     def _on_metrics_updated(self, original_info, compressed_info, reduction_rate):
         """Callback: métriques mises à jour"""
-        print("[DEBUG] Callback: Métriques mises à jour")
-        print(f"  Original info: {original_info}")
-        print(f"  Compressed info: {compressed_info}")
-        print(f"  Reduction rate: {reduction_rate}")
+        logger.debug("Métriques mises à jour: original %s, compressé %s, réduction %s",
+                     original_info, compressed_info, reduction_rate)
         self.viz_frame.update_metrics(original_info, compressed_info, reduction_rate)
     
     def keyPressEvent(self, event):
         """Gère les événements clavier"""
         if event.key() == Qt.Key.Key_Escape:
-            self.close()
+            # Échap annule d'abord la tâche en cours
+            if self.controller.is_busy():
+                self.controller.cancel()
+            else:
+                self.close()
         elif event.key() == Qt.Key.Key_Space:
+            # Espace arrête la lecture seulement (Échap et le bouton Stop annulent la tâche)
             self.controller.stop_playback()
         elif event.key() == Qt.Key.Key_F11:
             if self.isMaximized():
@@ -2,6 +2,8 @@
 Widgets personnalisés pour l'interface graphique - Version compacte
 """
 
+import time
+
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QProgressBar
@@ -184,8 +186,21 @@ class FileInfoFrame(QFrame):
 class StyledProgressBar(QProgressBar):
     """Barre de progression compacte"""
     
+    # Libellés des étages rapportés par AudioCompressor (callback progress)
+    STAGE_LABELS = {
+        'load': "Chargement",
+        'stereo': "Stéréo",
+        'encode': "Encodage",
+        'decode': "Décodage",
+    }
+    
+    # Avancement minimal avant d'afficher une estimation du temps restant
+    ETA_MIN_FRACTION = 0.05
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.started = None
+        self.fraction = 0.0
         self.setMinimum(0)
         self.setMaximum(100)
         self.setValue(0)
@@ -211,7 +226,35 @@ class StyledProgressBar(QProgressBar):
     
     def reset(self):
         """Réinitialise la barre"""
+        self.started = None
+        self.fraction = 0.0
+        self.setFormat("%p%")
         self.setValue(0)
+    
+    def set_progress(self, fraction: float, stage: str = None):
+        """
+        Affiche l'avancement, l'étage en cours et le temps restant estimé
+        
+        Le temps restant est extrapolé depuis le début de l'opération
+        (première valeur reçue, ou retour en arrière de l'avancement).
+        
+        Args:
+            fraction: Avancement global, de 0 à 1
+            stage: Nom de l'étage (voir STAGE_LABELS)
+        """
+        now = time.monotonic()
+        if self.started is None or fraction < self.fraction:
+            self.started = now
+        self.fraction = fraction
+        
+        text = "%p%"
+        if stage:
+            text += f" · {self.STAGE_LABELS.get(stage, stage)}"
+        if self.ETA_MIN_FRACTION <= fraction < 1.0:
+            remaining = (now - self.started) * (1.0 - fraction) / fraction
+            text += f" · ~{remaining:.0f} s"
+        self.setFormat(text)
+        self.setValue(round(100 * fraction))
 
 
 class CompressionInfoLabel(QLabel):
@@ -0,0 +1,57 @@
+"""
+Exécution des opérations longues hors du thread de l'interface
+Les tâches tournent dans le QThreadPool; résultats, erreurs et progression
+reviennent par signaux, traités dans le thread de l'interface
+"""
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from core.progress import OperationCancelled
+
+
+class TaskSignals(QObject):
+    """Signaux d'une tâche (créés dans le thread de l'interface: connexions en file d'attente)"""
+    
+    progress = Signal(str, float)  # (étage, progression 0-1)
+    finished = Signal(object)  # Résultat de la fonction
+    failed = Signal(str)  # Message d'erreur
+    cancelled = Signal()
+
+
+class CodecTask(QRunnable):
+    """
+    Tâche de compression/décompression exécutée dans le QThreadPool
+    
+    La fonction reçoit `progress` (callback étage, fraction) et `cancel`
+    (threading.Event) à transmettre à AudioCompressor: l'annulation prend
+    effet au prochain bloc ou à la prochaine trame.
+    """
+    
+    def __init__(self, function):
+        """
+        Args:
+            function: Fonction function(progress, cancel) rendant le résultat
+        """
+        super().__init__()
+        # Durée de vie gérée par le contrôleur (référence gardée en Python)
+        self.setAutoDelete(False)
+        self.function = function
+        self.signals = TaskSignals()
+        self.cancel_event = threading.Event()
+    
+    def run(self):
+        """Exécute la fonction et émet finished, failed ou cancelled"""
+        try:
+            result = self.function(self.signals.progress.emit, self.cancel_event)
+        except OperationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+    
+    def cancel(self):
+        """Demande l'arrêt de la tâche au prochain bloc"""
+        self.cancel_event.set()
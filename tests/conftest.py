@@ -0,0 +1,43 @@
+"""
+Configuration commune des tests: rend le paquet src importable et fournit
+un générateur de fichiers WAV synthétiques
+"""
+
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+src_path = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+
+SAMPLE_RATE = 44100
+
+
+@pytest.fixture
+def make_wav(tmp_path):
+    """
+    Écrit un WAV 16 bits à partir de canaux NumPy.
+    
+    Returns:
+        callable: make_wav(name, *channels) -> str, chemin du fichier écrit
+    """
+    def make(name, *channels):
+        samples = np.stack(channels, axis=1).astype(np.int16)
+        path = tmp_path / name
+        with wave.open(str(path), 'wb') as output:
+            output.setnchannels(len(channels))
+            output.setsampwidth(2)
+            output.setframerate(SAMPLE_RATE)
+            output.writeframes(samples.tobytes())
+        return str(path)
+    return make
+
+
+def tone(seconds, frequency=440.0, amplitude=8000):
+    """Sinusoïde de `seconds` secondes à SAMPLE_RATE"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return amplitude * np.sin(2 * np.pi * frequency * t)
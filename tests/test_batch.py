@@ -0,0 +1,33 @@
+"""
+Tests de la compression par lots
+"""
+
+import json
+
+from conftest import tone
+from core.batch import MANIFEST_NAME, run_batch
+
+
+def test_same_stem_keeps_both_outputs(make_wav, tmp_path):
+    # song.wav et song.WAV: même nom sans extension, deux fichiers distincts
+    make_wav('song.wav', tone(1, 440))
+    make_wav('song.WAV', tone(1, 660))
+    output_dir = tmp_path / 'out'
+    
+    summary = run_batch(str(tmp_path), str(output_dir), workers=1)
+    
+    assert summary['compressed'] == 2 and summary['failed'] == 0
+    assert (output_dir / 'song.wav.IRM').read_bytes() != (output_dir / 'song.WAV.IRM').read_bytes()
+    with open(output_dir / MANIFEST_NAME, encoding='utf-8') as f:
+        outputs = {json.loads(line)['output'] for line in f}
+    assert len(outputs) == 2
+
+
+def test_rerun_skips_done_files(make_wav, tmp_path):
+    make_wav('song.wav', tone(1))
+    output_dir = tmp_path / 'out'
+    run_batch(str(tmp_path), str(output_dir), workers=1)
+    
+    summary = run_batch(str(tmp_path), str(output_dir), workers=1)
+    
+    assert summary['skipped'] == 1 and summary['compressed'] == 0
@@ -0,0 +1,81 @@
+"""
+Tests du format .IRM: aller-retour par codeur, lecture des fichiers
+version 1, CRC de la version 3 et décodage d'une plage
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from conftest import tone
+from compression.entropy import ENTROPY_CODERS
+from core.compressor import AudioCompressor
+from core.container import map_file, read_header, verify
+
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# Fichier produit par la version d'origine (1 s stéréo à 8 kHz) et
+# empreinte de son décodage par cette même version
+BASELINE_V1 = DATA_DIR / "baseline_v1.IRM"
+BASELINE_V1_SHA256 = "465ce8fd96fcb784b3051a1a5ca09c14d7a427010a1fcd869cc64be08ee94430"
+
+
+@pytest.fixture
+def stereo(make_wav):
+    """Stéréo 3 s: canaux différents (mode 's')"""
+    return make_wav('stereo.wav', tone(3, 440), tone(3, 660, 5000))
+
+
+def _compress(source, tmp_path, coder='huffman'):
+    output = str(tmp_path / f'{coder}.IRM')
+    AudioCompressor.compress(source, output, coder=coder, frame_ms=1000, profile=False)
+    return output
+
+
+@pytest.mark.parametrize('coder', sorted(ENTROPY_CODERS))
+def test_round_trip_per_coder(stereo, tmp_path, coder):
+    # Le codage entropique est sans perte: tous les codeurs décodent le même signal
+    reference = AudioCompressor.decompress(_compress(stereo, tmp_path))
+    decoded = AudioCompressor.decompress(_compress(stereo, tmp_path, coder))
+    
+    assert len(decoded) == 3000
+    assert decoded.raw_data == reference.raw_data
+    
+    
+def test_baseline_v1_decodes_identically():
+    decoded = AudioCompressor.decompress(str(BASELINE_V1))
+    
+    assert decoded.channels == 2
+    assert decoded.frame_rate == 8000
+    assert hashlib.sha256(decoded.raw_data).hexdigest() == BASELINE_V1_SHA256
+    
+    
+def test_baseline_v1_verifies():
+    with map_file(str(BASELINE_V1)) as buffer:
+        assert verify(buffer) == 1
+        
+        
+def test_v3_crc_detects_corruption(stereo, tmp_path):
+    path = Path(_compress(stereo, tmp_path))
+    content = bytearray(path.read_bytes())
+    offset, size, _ = read_header(content)[1][b'DATA']
+    content[offset + size // 2] ^= 0xFF
+    path.write_bytes(bytes(content))
+    
+    with map_file(str(path)) as buffer:
+        with pytest.raises(ValueError):
+            verify(buffer)
+    with pytest.raises(ValueError):
+        AudioCompressor.decompress(str(path))
+        
+        
+@pytest.mark.parametrize('start_ms, end_ms', [(0, 500), (700, 2300), (1000, 2000), (2500, None)])
+def test_range_matches_full_decode(stereo, tmp_path, start_ms, end_ms):
+    path = _compress(stereo, tmp_path)
+    full = AudioCompressor.decompress(path)
+    part = AudioCompressor.decompress(path, start_ms=start_ms, end_ms=end_ms)
+    
+    assert part.raw_data == full[start_ms:end_ms].raw_data
@@ -0,0 +1,39 @@
+"""
+Tests des codeurs entropiques (aller-retour sur des résidus Delta)
+"""
+
+import numpy as np
+import pytest
+
+from compression.entropy import ENTROPY_CODERS, HuffmanCoder, encode_residuals
+
+
+def _residuals(kind):
+    rng = np.random.default_rng(0)
+    if kind == 'laplace':
+        return np.clip(rng.laplace(0, 6, 20000), -255, 255).astype(np.int16)
+    if kind == 'zeros':
+        return np.zeros(5000, dtype=np.int16)
+    if kind == 'wide':
+        return rng.integers(-255, 256, 20000).astype(np.int16)
+    return np.array([3], dtype=np.int16)
+
+
+@pytest.mark.parametrize('kind', ['laplace', 'zeros', 'wide', 'single'])
+@pytest.mark.parametrize('name', sorted(ENTROPY_CODERS))
+def test_round_trip(name, kind):
+    residuals = _residuals(kind)
+    coder, num_symbols, table, payload = encode_residuals(ENTROPY_CODERS[name], residuals)
+    
+    decoded = coder.decode(table, payload, num_symbols, len(residuals))
+    np.testing.assert_array_equal(decoded, residuals)
+
+
+def test_rans_falls_back_to_huffman_on_large_alphabet():
+    # 511 valeurs × 20 longueurs de plage: plus de 8192 paires (valeur, nombre)
+    values = np.arange(-255, 256, dtype=np.int16)
+    residuals = np.concatenate([np.repeat(values, count) for count in range(1, 21)])
+    coder, num_symbols, table, payload = encode_residuals(ENTROPY_CODERS['rans'], residuals)
+    
+    assert coder is HuffmanCoder
+    np.testing.assert_array_equal(coder.decode(table, payload, num_symbols, len(residuals)), residuals)
@@ -0,0 +1,50 @@
+"""
+Tests de la compression en flux (compress_stream) face à compress
+"""
+
+import numpy as np
+import pytest
+
+from conftest import tone
+from core.compressor import AudioCompressor
+
+
+@pytest.fixture
+def leading_silence(make_wav):
+    """Stéréo: 6 s de silence puis 3 s de canaux identiques"""
+    signal = np.concatenate([np.zeros(6 * 44100), tone(3)])
+    return make_wav('lead.wav', signal, signal)
+
+
+def test_streamed_leading_silence_keeps_duration(leading_silence, tmp_path):
+    in_memory = str(tmp_path / 'memory.IRM')
+    streamed = str(tmp_path / 'stream.IRM')
+    AudioCompressor.compress(leading_silence, in_memory, profile=False)
+    AudioCompressor.compress_stream(leading_silence, streamed, frame_ms=1000, profile=False)
+    
+    expected = len(AudioCompressor.decompress(in_memory))
+    assert expected == 9000
+    assert len(AudioCompressor.decompress(streamed)) == expected
+
+
+def test_streamed_silence_only_keeps_duration(make_wav, tmp_path):
+    silence = np.zeros(2 * 44100)
+    path = make_wav('silence.wav', silence, silence)
+    streamed = str(tmp_path / 'stream.IRM')
+    AudioCompressor.compress_stream(path, streamed, frame_ms=1000, profile=False)
+    
+    assert len(AudioCompressor.decompress(streamed)) == 2000
+
+
+@pytest.mark.parametrize('channels', [1, 2])
+def test_streamed_matches_in_memory(make_wav, tmp_path, channels):
+    signals = [tone(3, 440), tone(3, 660, 5000)][:channels]
+    path = make_wav('source.wav', *signals)
+    in_memory = tmp_path / 'memory.IRM'
+    streamed = tmp_path / 'stream.IRM'
+    AudioCompressor.compress(path, str(in_memory), frame_ms=1000, profile=False)
+    AudioCompressor.compress_stream(path, str(streamed), frame_ms=1000, profile=False)
+    
+    assert streamed.read_bytes() == in_memory.read_bytes()
+    assert (AudioCompressor.decompress(str(streamed)).raw_data
+            == AudioCompressor.decompress(str(in_memory)).raw_data)